@@ -0,0 +1,19 @@
+import pytest
+
+
+SERIAL_GROUPS = {
+    "TestEmergencyWorkflow": "emergency",
+}
+
+
+def pytest_configure(config):
+    config.addinivalue_line(
+        "markers", "xdist_group(name): run all tests in the group on the same xdist worker"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    for item in items:
+        group = SERIAL_GROUPS.get(getattr(item.cls, "__name__", None))
+        if group is not None:
+            item.add_marker(pytest.mark.xdist_group(group))
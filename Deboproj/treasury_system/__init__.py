@@ -1,23 +1,23 @@
 from .models import (
     Transaction, TransactionType, Category, Proposal, ProposalStatus,
-    TreasuryBalance, TreasuryConfig, Signature, EmergencyAction,
-    SpendingRecord, PeriodType
+    TreasuryBalance, TreasuryConfig, Signature, SignatureSet,
+    EmergencyAction, SpendingRecord, PeriodType, ExecutionCheck, batch_compute_hashes
 )
 from .policies import (
     BasePolicy, SpendingLimitPolicy, WhitelistPolicy, CategoryPolicy,
     TimeLockPolicy, AmountThresholdPolicy, ApprovalPolicy,
     PolicyManager, PolicyViolation
 )
-from .treasury import Treasury, TreasuryAuditLog
+from .treasury import Treasury, TreasuryAuditLog, AUDIT_DETAIL_BASIC, AUDIT_DETAIL_VERBOSE
 from .emergency import EmergencyModule
 
 __all__ = [
     'Transaction', 'TransactionType', 'Category', 'Proposal', 'ProposalStatus',
-    'TreasuryBalance', 'TreasuryConfig', 'Signature', 'EmergencyAction',
-    'SpendingRecord', 'PeriodType',
+    'TreasuryBalance', 'TreasuryConfig', 'Signature', 'SignatureSet',
+    'EmergencyAction', 'SpendingRecord', 'PeriodType', 'ExecutionCheck', 'batch_compute_hashes',
     'BasePolicy', 'SpendingLimitPolicy', 'WhitelistPolicy', 'CategoryPolicy',
     'TimeLockPolicy', 'AmountThresholdPolicy', 'ApprovalPolicy',
     'PolicyManager', 'PolicyViolation',
-    'Treasury', 'TreasuryAuditLog',
+    'Treasury', 'TreasuryAuditLog', 'AUDIT_DETAIL_BASIC', 'AUDIT_DETAIL_VERBOSE',
     'EmergencyModule'
 ]
@@ -1,14 +1,16 @@
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Dict, Optional, Set
-import uuid
-from .models import EmergencyAction, Signature
+from typing import Dict, Iterable, Optional
+from .models import EmergencyAction, generate_id
 
 
 class EmergencyModule:
-    def __init__(self, emergency_threshold: int, emergency_signers: Set[str]):
+    def __init__(self, emergency_threshold: int, emergency_signers: Iterable[str]):
         self.emergency_threshold = emergency_threshold
-        self.emergency_signers = emergency_signers
+        self.emergency_signers = frozenset(emergency_signers)
+        self._signer_positions: Dict[str, int] = {
+            signer: i for i, signer in enumerate(sorted(self.emergency_signers))
+        }
         self.actions: Dict[str, EmergencyAction] = {}
 
     def create_emergency_action(
@@ -21,7 +23,7 @@ class EmergencyModule:
         if initiator not in self.emergency_signers:
             raise PermissionError(f"{initiator} is not an emergency signer")
 
-        action_id = str(uuid.uuid4())
+        action_id = generate_id()
         action = EmergencyAction(
             action_id=action_id,
             action_type=action_type,
@@ -39,42 +41,45 @@ class EmergencyModule:
         signature: str,
         current_time: datetime
     ) -> None:
-        if action_id not in self.actions:
+        action = self.actions.get(action_id)
+        if action is None:
             raise ValueError(f"Emergency action {action_id} not found")
 
         if signer not in self.emergency_signers:
             raise PermissionError(f"{signer} is not an emergency signer")
 
-        action = self.actions[action_id]
+        signer_bit = self.signer_bit(signer)
 
-        if signer in action.signatures:
+        if action.signer_mask & signer_bit:
             raise ValueError(f"{signer} has already signed this action")
 
         if action.executed:
             raise ValueError("Cannot sign an executed emergency action")
 
-        action.signatures[signer] = Signature(
-            signer=signer,
-            signature=signature,
-            timestamp=current_time,
-            tx_hash=action.action_id
-        )
+        action.add_signature(signer, signature, current_time, signer_bit)
+        if not action.threshold_reached and action.has_threshold(self.emergency_threshold):
+            verified = action.signatures.count_verified(action.action_id, self.emergency_threshold)
+            action.threshold_reached = verified >= self.emergency_threshold
+
+    # emergency_signers is public and may be reassigned directly, so signers
+    # the index has not seen yet are given a position on first use.
+    def signer_bit(self, signer: str) -> int:
+        position = self._signer_positions.get(signer)
+        if position is None:
+            position = self._signer_positions[signer] = len(self._signer_positions)
+        return 1 << position
 
     def get_action(self, action_id: str) -> Optional[EmergencyAction]:
         return self.actions.get(action_id)
 
     def can_execute_action(self, action_id: str) -> bool:
-        if action_id not in self.actions:
-            return False
-
-        action = self.actions[action_id]
-        return (len(action.signatures) >= self.emergency_threshold and
-                not action.executed)
+        action = self.actions.get(action_id)
+        return action is not None and action.threshold_reached and not action.executed
 
     def add_emergency_signer(self, signer: str) -> None:
-        self.emergency_signers.add(signer)
+        self.emergency_signers = self.emergency_signers | {signer}
 
     def remove_emergency_signer(self, signer: str) -> None:
         if len(self.emergency_signers) <= self.emergency_threshold:
             raise ValueError("Cannot remove signer when it would drop below threshold")
-        self.emergency_signers.discard(signer)
+        self.emergency_signers = self.emergency_signers - {signer}
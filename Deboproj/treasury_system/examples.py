@@ -187,10 +187,9 @@ def example_batch_transactions(treasury):
         for i in range(5)
     ]
     
-    for tx in transactions:
-        for policy in treasury.policy_manager.policies.values():
-            if hasattr(policy, 'add_recipient'):
-                policy.add_recipient(tx.recipient)
+    for policy in treasury.policy_manager.get_whitelist_policies():
+        for tx in transactions:
+            policy.add_recipient(tx.recipient)
 
     proposal_id = treasury.create_proposal(
         creator="bob",
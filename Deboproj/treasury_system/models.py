@@ -1,9 +1,15 @@
+from array import array
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Dict, List, Optional, Set
+from typing import Dict, FrozenSet, KeysView, List, Optional, Set, Tuple
 from datetime import datetime, timedelta
 import hashlib
+import itertools
 import json
+import secrets
+import struct
+import sys
 
 
 class Category(str, Enum):
@@ -16,12 +22,21 @@ class Category(str, Enum):
 
 
 class ProposalStatus(str, Enum):
-    PENDING = "pending"
-    TIME_LOCKED = "time_locked"
-    READY_TO_EXECUTE = "ready_to_execute"
-    EXECUTED = "executed"
-    CANCELLED = "cancelled"
-    FAILED = "failed"
+    PENDING = "pending", 1
+    TIME_LOCKED = "time_locked", 2
+    READY_TO_EXECUTE = "ready_to_execute", 4
+    EXECUTED = "executed", 8
+    CANCELLED = "cancelled", 16
+    FAILED = "failed", 32
+
+    def __new__(cls, value: str, bit: int):
+        member = str.__new__(cls, value)
+        member._value_ = value
+        member.bit = bit
+        return member
+
+
+_EXECUTABLE_MASK = ProposalStatus.PENDING.bit | ProposalStatus.TIME_LOCKED.bit
 
 
 class TransactionType(str, Enum):
@@ -36,7 +51,39 @@ class PeriodType(str, Enum):
     MONTHLY = "monthly"
 
 
-@dataclass
+class ExecutionCheck(str, Enum):
+    OK = "ok"
+    MISSING_COIN = "missing_coin"
+    INSUFFICIENT_BALANCE = "insufficient_balance"
+    INVALID_AMOUNT = "invalid_amount"
+
+
+_TX_TYPE_VALUES: Dict[TransactionType, str] = {t: t.value for t in TransactionType}
+_CATEGORY_VALUES: Dict[Category, str] = {c: c.value for c in Category}
+_STATUS_VALUES: Dict[ProposalStatus, str] = {s: s.value for s in ProposalStatus}
+_TX_TYPE_BYTE: Dict[TransactionType, bytes] = {t: bytes((i,)) for i, t in enumerate(TransactionType)}
+
+_id_prefix = secrets.token_urlsafe(6)
+_next_id = itertools.count().__next__
+
+
+def generate_id() -> str:
+    return f"{_id_prefix}-{_next_id():x}"
+
+
+def _pack_bytes(data: bytes) -> bytes:
+    return struct.pack(">I", len(data)) + data
+
+
+def _pack_str(value: str) -> bytes:
+    return _pack_bytes(value.encode())
+
+
+def _dumps_sorted(value) -> bytes:
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode()
+
+
+@dataclass(frozen=True, slots=True)
 class Transaction:
     tx_id: str
     tx_type: TransactionType
@@ -45,11 +92,17 @@ class Transaction:
     coin_type: str = "SUI"
     description: str = ""
     metadata: Dict = field(default_factory=dict)
+    _hash: Optional[bytes] = field(default=None, init=False, repr=False, compare=False)
+    _cached_hash: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        object.__setattr__(self, "coin_type", sys.intern(self.coin_type))
+        object.__setattr__(self, "recipient", sys.intern(self.recipient))
 
     def to_dict(self) -> Dict:
         return {
             "tx_id": self.tx_id,
-            "tx_type": self.tx_type.value,
+            "tx_type": _TX_TYPE_VALUES[self.tx_type],
             "recipient": self.recipient,
             "amount": self.amount,
             "coin_type": self.coin_type,
@@ -57,23 +110,128 @@ class Transaction:
             "metadata": self.metadata
         }
 
+    def _canonical_bytes(self) -> bytes:
+        if self.metadata:
+            metadata = b"\x01" + _pack_bytes(_dumps_sorted(self.metadata))
+        else:
+            metadata = b"\x00"
+        return b"".join((
+            _pack_str(self.tx_id),
+            _TX_TYPE_BYTE[self.tx_type],
+            _pack_str(self.recipient),
+            struct.pack(">d", self.amount),
+            _pack_str(self.coin_type),
+            _pack_str(self.description),
+            metadata
+        ))
+
+    def compute_hash_bytes(self) -> bytes:
+        if self._hash is None:
+            digest = hashlib.sha256()
+            digest.update(self._canonical_bytes())
+            object.__setattr__(self, "_hash", digest.digest())
+        return self._hash
+
     def compute_hash(self) -> str:
-        data = json.dumps(self.to_dict(), sort_keys=True)
-        return hashlib.sha256(data.encode()).hexdigest()
+        if self._cached_hash is None:
+            object.__setattr__(self, "_cached_hash", self.compute_hash_bytes().hex())
+        return self._cached_hash
+
+
+def batch_compute_hashes(transactions: List[Transaction]) -> List[bytes]:
+    buffer = bytearray()
+    records = []
+    for transaction in transactions:
+        if transaction._hash is None:
+            start = len(buffer)
+            buffer += transaction._canonical_bytes()
+            records.append((transaction, start, len(buffer)))
 
+    view = memoryview(buffer)
+    for transaction, start, end in records:
+        object.__setattr__(transaction, "_hash", hashlib.sha256(view[start:end]).digest())
+    return [transaction._hash for transaction in transactions]
 
-@dataclass
+
+@dataclass(slots=True)
 class Signature:
     signer: str
     signature: str
     timestamp: datetime
     tx_hash: str
 
+    def __post_init__(self):
+        self.signer = sys.intern(self.signer)
+        if isinstance(self.tx_hash, str):
+            self.tx_hash = sys.intern(self.tx_hash)
+
     def verify_signature(self) -> bool:
         return len(self.signature) > 0 and len(self.signer) > 0
 
 
-@dataclass
+_LINEAR_SCAN_LIMIT = 8
+
+
+class SignatureSet(Mapping):
+    __slots__ = ("signers", "signature_values", "timestamps", "tx_hashes", "_index")
+
+    def __init__(self, signatures: Optional[Dict[str, Signature]] = None):
+        self.signers: List[str] = []
+        self.signature_values: List[str] = []
+        self.timestamps: List[datetime] = []
+        self.tx_hashes: List[str] = []
+        self._index: Dict[str, int] = {}
+        if signatures:
+            for sig in signatures.values():
+                self.add(sig.signer, sig.signature, sig.timestamp, sig.tx_hash)
+
+    def add(self, signer: str, signature: str, timestamp: datetime, tx_hash: str) -> None:
+        if signer in self._index:
+            raise ValueError(f"{signer} has already signed")
+        signer = sys.intern(signer)
+        self._index[signer] = len(self.signers)
+        self.signers.append(signer)
+        self.signature_values.append(signature)
+        self.timestamps.append(timestamp)
+        self.tx_hashes.append(tx_hash)
+
+    def count_verified(self, tx_hash: str, required: int) -> int:
+        verified = 0
+        for signer, signature, sig_hash in zip(self.signers, self.signature_values, self.tx_hashes):
+            if sig_hash == tx_hash and signature and signer:
+                verified += 1
+                if verified >= required:
+                    break
+        return verified
+
+    def __setitem__(self, signer: str, sig: Signature) -> None:
+        self.add(signer, sig.signature, sig.timestamp, sig.tx_hash)
+
+    def __getitem__(self, signer: str) -> Signature:
+        i = self._index[signer]
+        return Signature(
+            signer=self.signers[i],
+            signature=self.signature_values[i],
+            timestamp=self.timestamps[i],
+            tx_hash=self.tx_hashes[i]
+        )
+
+    def __contains__(self, signer: object) -> bool:
+        if len(self.signers) <= _LINEAR_SCAN_LIMIT:
+            return signer in self.signers
+        return signer in self._index
+
+    def __iter__(self):
+        return iter(self.signers)
+
+    def __len__(self) -> int:
+        return len(self.signers)
+
+    def __repr__(self) -> str:
+        return f"SignatureSet({self.signers!r})"
+
+
+@dataclass(slots=True)
 class Proposal:
     proposal_id: str
     creator: str
@@ -84,24 +242,57 @@ class Proposal:
     created_at: datetime
     time_lock_duration: int
     status: ProposalStatus = ProposalStatus.PENDING
-    signatures: Dict[str, Signature] = field(default_factory=dict)
+    signatures: SignatureSet = field(default_factory=SignatureSet)
     executed_at: Optional[datetime] = None
     cancelled_at: Optional[datetime] = None
-
-    def can_execute(self, current_time: datetime) -> bool:
-        time_locked_at = self.created_at + timedelta(seconds=self.time_lock_duration)
-        return (current_time >= time_locked_at and
-                len(self.signatures) >= self.threshold_required and
-                self.status in [ProposalStatus.PENDING, ProposalStatus.TIME_LOCKED])
+    signer_mask: int = 0
+    _verified_count: int = field(default=0, init=False, repr=False, compare=False)
+    _tx_hashes: Optional[Tuple[bytes, ...]] = field(default=None, init=False, repr=False, compare=False)
+    _cached_hash: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _threshold_reached_at: Optional[datetime] = field(default=None, init=False, repr=False, compare=False)
+    unlock_at: datetime = field(init=False, repr=False, compare=False)
+    created_at_ts: float = field(init=False, repr=False, compare=False)
+    unlock_ts: float = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if not isinstance(self.signatures, SignatureSet):
+            self.signatures = SignatureSet(self.signatures)
+        if self.signatures and not self.signer_mask:
+            self.signer_mask = (1 << len(self.signatures)) - 1
+        if self.signatures and self.signer_mask.bit_count() >= self.threshold_required:
+            self._threshold_reached_at = max(self.signatures.timestamps)
+        self.unlock_at = self.created_at + timedelta(seconds=self.time_lock_duration)
+        self.created_at_ts = self.created_at.timestamp()
+        self.unlock_ts = self.created_at_ts + self.time_lock_duration
+
+    def add_signature(self, signer: str, signature: str, timestamp: datetime, tx_hash: str, signer_bit: int) -> None:
+        self.signatures.add(signer, signature, timestamp, tx_hash)
+        self.signer_mask |= signer_bit
+        if self._threshold_reached_at is None and self.signer_mask.bit_count() >= self.threshold_required:
+            self._threshold_reached_at = timestamp
+
+    def can_execute(self, current_time: datetime, current_ts: Optional[float] = None) -> bool:
+        if self._threshold_reached_at is None or not self.status.bit & _EXECUTABLE_MASK:
+            return False
+        if current_ts is not None:
+            return current_ts >= self.unlock_ts
+        return current_time >= self.unlock_at
 
     def get_signature_count(self) -> int:
-        return len(self.signatures)
+        return self.signer_mask.bit_count()
 
     def is_signed_by(self, signer: str) -> bool:
         return signer in self.signatures
 
+    def verify_signatures(self, tx_hash: str) -> bool:
+        self._verified_count = self.signatures.count_verified(tx_hash, self.threshold_required)
+        return self.has_quorum()
+
+    def has_quorum(self) -> bool:
+        return self._verified_count >= self.threshold_required
 
-@dataclass
+
+@dataclass(slots=True)
 class SpendingRecord:
     amount: float
     timestamp: datetime
@@ -110,55 +301,130 @@ class SpendingRecord:
     tx_hash: str
 
 
-@dataclass
 class TreasuryBalance:
-    coin_type: str
-    amount: float
-    last_updated: datetime
-
-    def deposit(self, amount: float) -> None:
-        if amount <= 0:
-            raise ValueError("Deposit amount must be positive")
-        self.amount += amount
-        self.last_updated = datetime.now()
-
-    def withdraw(self, amount: float) -> bool:
-        if amount <= 0:
-            raise ValueError("Withdrawal amount must be positive")
-        if amount > self.amount:
-            return False
-        self.amount -= amount
-        self.last_updated = datetime.now()
-        return True
+    # Read-only view of one coin's slot in the treasury's balance columns.
+    __slots__ = ("_coin_type", "_amounts", "_last_updated", "_index")
+
+    def __init__(self, coin_type: str, amounts: array, last_updated: List[datetime], index: int):
+        self._coin_type = coin_type
+        self._amounts = amounts
+        self._last_updated = last_updated
+        self._index = index
+
+    @property
+    def coin_type(self) -> str:
+        return self._coin_type
 
+    @property
+    def amount(self) -> float:
+        return self._amounts[self._index]
 
-@dataclass
+    @property
+    def last_updated(self) -> datetime:
+        return self._last_updated[self._index]
+
+    def __repr__(self) -> str:
+        return f"TreasuryBalance(coin_type={self.coin_type!r}, amount={self.amount!r}, last_updated={self.last_updated!r})"
+
+
+@dataclass(slots=True)
 class EmergencyAction:
     action_id: str
     action_type: str
     initiated_by: str
     initiated_at: datetime
     reason: str
-    signatures: Dict[str, Signature] = field(default_factory=dict)
+    signatures: SignatureSet = field(default_factory=SignatureSet)
     executed: bool = False
     executed_at: Optional[datetime] = None
+    signer_mask: int = 0
+    threshold_reached: bool = False
+
+    def __post_init__(self):
+        self.action_type = sys.intern(self.action_type)
+        if not isinstance(self.signatures, SignatureSet):
+            self.signatures = SignatureSet(self.signatures)
+        if self.signatures and not self.signer_mask:
+            self.signer_mask = (1 << len(self.signatures)) - 1
+
+    def add_signature(self, signer: str, signature: str, timestamp: datetime, signer_bit: int) -> None:
+        self.signatures.add(signer, signature, timestamp, self.action_id)
+        self.signer_mask |= signer_bit
 
+    def has_threshold(self, threshold: int) -> bool:
+        return self.signer_mask.bit_count() >= threshold
 
-@dataclass
+
+@dataclass(slots=True)
 class TreasuryConfig:
     treasury_id: str
-    signers: Set[str]
+    signers: FrozenSet[str]
     threshold: int
     emergency_threshold: int
-    emergency_signers: Set[str]
+    emergency_signers: FrozenSet[str]
     emergency_cooldown: int = 86400
     last_emergency_at: Optional[datetime] = None
+    _signer_index: Dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _signer_mask: int = field(default=0, init=False, repr=False)
+    _next_position: int = field(default=0, init=False, repr=False)
+    _signers_snapshot: Tuple[str, ...] = field(default=(), init=False, repr=False)
+
+    def __post_init__(self):
+        self.signers = frozenset(self.signers)
+        self.emergency_signers = frozenset(self.emergency_signers)
+        self._signers_snapshot = tuple(sorted(self.signers))
+        for signer in self._signers_snapshot:
+            self._index_signer(signer)
+
+    def _index_signer(self, signer: str) -> None:
+        if signer in self._signer_index:
+            return
+        # Positions are never reused so a removed signer's bit cannot be
+        # inherited by a newcomer on proposals that are still open.
+        position = self._signer_index[signer] = self._next_position
+        self._next_position += 1
+        self._signer_mask |= 1 << position
+
+    @property
+    def signer_keys(self) -> KeysView:
+        return self._signer_index.keys()
+
+    @property
+    def signers_snapshot(self) -> Tuple[str, ...]:
+        return self._signers_snapshot
+
+    @property
+    def signer_mask(self) -> int:
+        return self._signer_mask
+
+    def signer_bit(self, signer: str) -> int:
+        position = self._signer_index.get(signer)
+        if position is None:
+            # signers was reassigned directly; index the newcomer on first use.
+            self._index_signer(signer)
+            position = self._signer_index[signer]
+        return 1 << position
 
     def is_valid_signer(self, signer: str) -> bool:
-        return signer in self.signers
+        return signer in self._signer_index
+
+    def add_signer(self, signer: str) -> None:
+        self.signers = self.signers | {signer}
+        self._signers_snapshot = tuple(sorted(self.signers))
+        self._index_signer(signer)
+
+    def remove_signer(self, signer: str) -> None:
+        self.signers = self.signers - {signer}
+        self._signers_snapshot = tuple(sorted(self.signers))
+        self.emergency_signers = self.emergency_signers - {signer}
+        position = self._signer_index.pop(signer, None)
+        if position is not None:
+            self._signer_mask &= ~(1 << position)
+
+    def record_emergency(self, current_time: datetime) -> None:
+        self.last_emergency_at = current_time
 
     def can_trigger_emergency(self, current_time: datetime) -> bool:
         if self.last_emergency_at is None:
             return True
-        elapsed = (current_time - self.last_emergency_at).total_seconds()
-        return elapsed >= self.emergency_cooldown
+        return current_time >= self.last_emergency_at + timedelta(seconds=self.emergency_cooldown)
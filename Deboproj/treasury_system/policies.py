@@ -1,9 +1,28 @@
 from abc import ABC, abstractmethod
+from array import array
+import bisect
 from dataclasses import dataclass, field
-from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Tuple
+from datetime import datetime, timedelta, tzinfo
+from functools import lru_cache
+import heapq
+from itertools import compress
+import math
+import sys
+from operator import and_
+from types import MappingProxyType
+from typing import Dict, KeysView, List, Optional, Set, Tuple
 from .models import Category, Transaction, PeriodType, SpendingRecord
 
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
+    prange = range
+
+
+_CATEGORY_IDS = {category: index for index, category in enumerate(Category)}
+_PARALLEL_SCAN_THRESHOLD = 50_000
+
 
 class PolicyViolation(Exception):
     def __init__(self, policy_name: str, message: str):
@@ -12,21 +31,152 @@ class PolicyViolation(Exception):
         super().__init__(f"{policy_name}: {message}")
 
 
+@lru_cache(maxsize=4096)
+def _period_start(period_type: PeriodType, year: int, month: int, day: int, weekday: int,
+                  tz: Optional[tzinfo] = None) -> Optional[datetime]:
+    if period_type == PeriodType.DAILY:
+        return datetime(year, month, day, tzinfo=tz)
+    elif period_type == PeriodType.WEEKLY:
+        return datetime(year, month, day, tzinfo=tz) - timedelta(days=weekday)
+    elif period_type == PeriodType.MONTHLY:
+        return datetime(year, month, 1, tzinfo=tz)
+
+
+@lru_cache(maxsize=4096)
+def _period_start_ts(period_type: PeriodType, year: int, month: int, day: int, weekday: int,
+                     tz: Optional[tzinfo] = None) -> int:
+    return int(_period_start(period_type, year, month, day, weekday, tz).timestamp())
+
+
+def _by_category(table: Tuple, category: Category):
+    index = _CATEGORY_IDS.get(category)
+    return table[index] if index is not None else None
+
+
+def _context_time(context: Dict) -> datetime:
+    current_time = context.get("current_time")
+    return current_time if current_time is not None else datetime.now()
+
+
+# Policies run against a private copy that carries the resolved time and the
+# shared signer keys; only what the policies themselves add is copied back.
+def _prepare_context(context: Dict) -> Dict:
+    internal = dict(context)
+    internal["current_time"] = _context_time(context)
+    signatures = context.get("signatures")
+    if signatures is not None:
+        internal["_signer_keys"] = signatures.keys()
+    return internal
+
+
+def _publish_context(context: Dict, internal: Dict) -> None:
+    internal.pop("_signer_keys", None)
+    if context.get("current_time") is None:
+        del internal["current_time"]
+    context.update(internal)
+
+
+def _sum_filtered_loop(amounts, categories, timestamps, category_id, cutoff):
+    total = 0.0
+    for i in range(len(amounts)):
+        if timestamps[i] >= cutoff and (category_id < 0 or categories[i] == category_id):
+            total += amounts[i]
+    return total
+
+
+def _sum_filtered_par_loop(amounts, categories, timestamps, category_id, cutoff):
+    total = 0.0
+    for i in prange(len(amounts)):
+        if timestamps[i] >= cutoff and (category_id < 0 or categories[i] == category_id):
+            total += amounts[i]
+    return total
+
+
+def _sum_filtered_py(amounts, categories, timestamps, category_id, cutoff):
+    in_period = map(cutoff.__le__, timestamps)
+    if category_id < 0:
+        return sum(compress(amounts, in_period))
+    return sum(compress(amounts, map(and_, in_period, map(category_id.__eq__, categories))))
+
+
+if njit is not None:
+    _sum_filtered_serial = njit(cache=True)(_sum_filtered_loop)
+    _sum_filtered_parallel = njit(parallel=True, cache=True)(_sum_filtered_par_loop)
+
+    def _sum_filtered(amounts, categories, timestamps, category_id, cutoff):
+        if len(amounts) > _PARALLEL_SCAN_THRESHOLD:
+            return _sum_filtered_parallel(amounts, categories, timestamps, category_id, cutoff)
+        return _sum_filtered_serial(amounts, categories, timestamps, category_id, cutoff)
+
+    for _kernel in (_sum_filtered_serial, _sum_filtered_parallel):
+        _kernel(array("d", [0.0]), array("q", [0]), array("q", [0]), -1, 0)
+    del _kernel
+else:
+    _sum_filtered = _sum_filtered_py
+
+
 class BasePolicy(ABC):
+    __slots__ = ("policy_id", "enabled", "_sealed")
+
+    # Policies that only annotate the context (required time lock/threshold)
+    # and never raise; their output is only read when a proposal is created.
+    context_only = False
+
     def __init__(self, policy_id: str, enabled: bool = True):
         self.policy_id = policy_id
         self.enabled = enabled
+        self._sealed = False
+
+    def seal(self) -> None:
+        self._sealed = True
+
+    def is_sealed(self) -> bool:
+        return self._sealed
+
+    def _check_unsealed(self) -> None:
+        if self._sealed:
+            raise RuntimeError(f"Policy {self.policy_id} is sealed")
+
+    def __getstate__(self) -> Dict:
+        state = {}
+        for cls in type(self).__mro__:
+            for name in getattr(cls, "__slots__", ()):
+                if hasattr(self, name):
+                    value = getattr(self, name)
+                    state[name] = dict(value) if isinstance(value, MappingProxyType) else value
+        for name, value in getattr(self, "__dict__", {}).items():
+            state[name] = dict(value) if isinstance(value, MappingProxyType) else value
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        for name, value in state.items():
+            setattr(self, name, value)
+        if self._sealed:
+            self.seal()
 
     @abstractmethod
     def validate(self, transaction: Transaction, context: Dict) -> None:
         pass
 
+    def validate_batch(self, transactions: List[Transaction], amounts: List[float],
+                       recipients: List[str], context: Dict) -> None:
+        if not self.enabled:
+            return
+        for transaction in transactions:
+            self.validate(transaction, context)
+
     @abstractmethod
     def get_policy_type(self) -> str:
         pass
 
 
 class SpendingLimitPolicy(BasePolicy):
+    __slots__ = (
+        "period_type", "limit_per_category", "global_limit", "max_per_transaction",
+        "spending_history", "_amounts", "_category_ids", "_timestamps",
+        "_period_totals", "_period_global", "_pruned_before", "_limits",
+    )
+
     def __init__(self, policy_id: str, period_type: PeriodType, limit_per_category=None, 
                  global_limit=None, max_per_transaction=None, enabled=True):
         super().__init__(policy_id, enabled)
@@ -34,44 +184,97 @@ class SpendingLimitPolicy(BasePolicy):
         self.limit_per_category = limit_per_category or {}
         self.global_limit = global_limit
         self.max_per_transaction = max_per_transaction
-        self.spending_history = []
+        self.spending_history: List[SpendingRecord] = []
+        self._amounts = array("d")
+        self._category_ids = array("q")
+        self._timestamps = array("q")
+        self._period_totals: Dict[Tuple[int, Category], float] = {}
+        self._period_global: Dict[int, float] = {}
+        self._pruned_before: Optional[int] = None
+        self._limits: Optional[Tuple[Optional[float], ...]] = None
 
     def get_policy_type(self) -> str:
         return "spending_limit"
 
+    def seal(self) -> None:
+        limits = [None] * len(_CATEGORY_IDS)
+        for category, limit in self.limit_per_category.items():
+            limits[_CATEGORY_IDS[category]] = limit
+        self._limits = tuple(limits)
+        self.limit_per_category = MappingProxyType(dict(self.limit_per_category))
+        super().seal()
+
+    def _category_limit(self, category: Category) -> Optional[float]:
+        if self._limits is not None:
+            return _by_category(self._limits, category)
+        return self.limit_per_category.get(category)
+
     def add_spending_record(self, record: SpendingRecord) -> None:
         self.spending_history.append(record)
+        self._amounts.append(record.amount)
+        self._category_ids.append(_CATEGORY_IDS[record.category])
+        self._timestamps.append(math.floor(record.timestamp.timestamp()))
+        period_start = self.get_period_start_ts(record.timestamp)
+        if self._pruned_before is not None and period_start < self._pruned_before:
+            return
+        key = (period_start, record.category)
+        self._period_totals[key] = self._period_totals.get(key, 0.0) + record.amount
+        self._period_global[period_start] = self._period_global.get(period_start, 0.0) + record.amount
+
+    def _prune_before(self, period_start: int) -> None:
+        if self._pruned_before is not None and period_start <= self._pruned_before:
+            return
+        self._pruned_before = period_start
+        self._period_totals = {
+            key: amount for key, amount in self._period_totals.items() if key[0] >= period_start
+        }
+        self._period_global = {
+            start: amount for start, amount in self._period_global.items() if start >= period_start
+        }
 
     def get_period_start(self, current_time: datetime) -> datetime:
-        if self.period_type == PeriodType.DAILY:
-            return current_time.replace(hour=0, minute=0, second=0, microsecond=0)
-        elif self.period_type == PeriodType.WEEKLY:
-            days_since_monday = current_time.weekday()
-            return (current_time - timedelta(days=days_since_monday)).replace(
-                hour=0, minute=0, second=0, microsecond=0)
-        elif self.period_type == PeriodType.MONTHLY:
-            return current_time.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+        return _period_start(
+            self.period_type, current_time.year, current_time.month, current_time.day,
+            current_time.weekday(), current_time.tzinfo
+        )
 
-    def get_current_spending(self, category: Category, current_time: datetime) -> float:
-        period_start = self.get_period_start(current_time)
-        return sum(
-            record.amount for record in self.spending_history
-            if record.category == category and record.timestamp >= period_start
+    def get_period_start_ts(self, current_time: datetime) -> int:
+        return _period_start_ts(
+            self.period_type, current_time.year, current_time.month, current_time.day,
+            current_time.weekday(), current_time.tzinfo
         )
 
+    def get_current_spending(self, category: Category, current_time: datetime) -> float:
+        return self._sum(category, self.get_period_start_ts(current_time))
+
     def get_global_spending(self, current_time: datetime) -> float:
-        period_start = self.get_period_start(current_time)
+        return self._sum_global(self.get_period_start_ts(current_time))
+
+    def _sum(self, category: Category, period_start: int) -> float:
+        if self._pruned_before is not None and period_start < self._pruned_before:
+            return _sum_filtered(
+                self._amounts, self._category_ids, self._timestamps,
+                _CATEGORY_IDS[category], period_start
+            )
+        self._prune_before(period_start)
         return sum(
-            record.amount for record in self.spending_history
-            if record.timestamp >= period_start
+            amount for (start, record_category), amount in self._period_totals.items()
+            if record_category is category
         )
 
+    def _sum_global(self, period_start: int) -> float:
+        if self._pruned_before is not None and period_start < self._pruned_before:
+            return _sum_filtered(
+                self._amounts, self._category_ids, self._timestamps, -1, period_start
+            )
+        self._prune_before(period_start)
+        return sum(self._period_global.values())
+
     def validate(self, transaction: Transaction, context: Dict) -> None:
         if not self.enabled:
             return
-
         category = context.get("category", Category.OTHER)
-        current_time = context.get("current_time", datetime.now())
+        period_start = self.get_period_start_ts(_context_time(context))
 
         if self.max_per_transaction and transaction.amount > self.max_per_transaction:
             raise PolicyViolation(
@@ -79,9 +282,9 @@ class SpendingLimitPolicy(BasePolicy):
                 f"Transaction amount {transaction.amount} exceeds max per transaction {self.max_per_transaction}"
             )
 
-        if category in self.limit_per_category:
-            current_spending = self.get_current_spending(category, current_time)
-            limit = self.limit_per_category[category]
+        limit = self._category_limit(category)
+        if limit is not None:
+            current_spending = self._sum(category, period_start)
             if current_spending + transaction.amount > limit:
                 raise PolicyViolation(
                     self.policy_id,
@@ -90,7 +293,7 @@ class SpendingLimitPolicy(BasePolicy):
                 )
 
         if self.global_limit:
-            global_spending = self.get_global_spending(current_time)
+            global_spending = self._sum_global(period_start)
             if global_spending + transaction.amount > self.global_limit:
                 raise PolicyViolation(
                     self.policy_id,
@@ -98,32 +301,83 @@ class SpendingLimitPolicy(BasePolicy):
                     f"{global_spending} + {transaction.amount} > {self.global_limit}"
                 )
 
+    def validate_batch(self, transactions: List[Transaction], amounts: List[float],
+                       recipients: List[str], context: Dict) -> None:
+        if not self.enabled:
+            return
+        category = context.get("category", Category.OTHER)
+        period_start = self.get_period_start_ts(_context_time(context))
+        largest = max(amounts)
+
+        if self.max_per_transaction and largest > self.max_per_transaction:
+            self._raise_first(transactions, lambda amount: amount > self.max_per_transaction, context)
+
+        limit = self._category_limit(category)
+        if limit is not None:
+            current_spending = self._sum(category, period_start)
+            if current_spending + largest > limit:
+                self._raise_first(transactions, lambda amount: current_spending + amount > limit, context)
+
+        if self.global_limit:
+            global_spending = self._sum_global(period_start)
+            if global_spending + largest > self.global_limit:
+                self._raise_first(
+                    transactions, lambda amount: global_spending + amount > self.global_limit, context
+                )
+
+    def _raise_first(self, transactions: List[Transaction], exceeds, context: Dict) -> None:
+        for transaction in transactions:
+            if exceeds(transaction.amount):
+                self.validate(transaction, context)
+
 
 class WhitelistPolicy(BasePolicy):
+    __slots__ = ("approved_recipients", "blacklisted_recipients", "temporary_entries", "_expiry_heap")
+
     def __init__(self, policy_id: str, enabled=True):
         super().__init__(policy_id, enabled)
         self.approved_recipients = set()
         self.blacklisted_recipients = set()
         self.temporary_entries = {}
+        self._expiry_heap: List[Tuple[datetime, str]] = []
 
     def get_policy_type(self) -> str:
         return "whitelist"
 
     def add_recipient(self, recipient: str) -> None:
+        self._check_unsealed()
+        recipient = sys.intern(recipient)
         if recipient in self.blacklisted_recipients:
             raise ValueError(f"Recipient {recipient} is blacklisted")
         self.approved_recipients.add(recipient)
 
     def add_temporary_recipient(self, recipient: str, expires_at: datetime) -> None:
+        recipient = sys.intern(recipient)
         if recipient in self.blacklisted_recipients:
             raise ValueError(f"Recipient {recipient} is blacklisted")
         self.temporary_entries[recipient] = expires_at
+        heapq.heappush(self._expiry_heap, (expires_at, recipient))
+
+    def seal(self) -> None:
+        self.approved_recipients = frozenset(self.approved_recipients)
+        self.blacklisted_recipients = frozenset(self.blacklisted_recipients)
+        super().seal()
+
+    def purge_expired(self, current_time: datetime) -> None:
+        heap = self._expiry_heap
+        while heap and heap[0][0] <= current_time:
+            expires_at, recipient = heapq.heappop(heap)
+            if self.temporary_entries.get(recipient) == expires_at:
+                del self.temporary_entries[recipient]
 
     def remove_recipient(self, recipient: str) -> None:
+        self._check_unsealed()
         self.approved_recipients.discard(recipient)
         self.temporary_entries.pop(recipient, None)
 
     def blacklist_recipient(self, recipient: str) -> None:
+        self._check_unsealed()
+        recipient = sys.intern(recipient)
         self.approved_recipients.discard(recipient)
         self.temporary_entries.pop(recipient, None)
         self.blacklisted_recipients.add(recipient)
@@ -135,20 +389,14 @@ class WhitelistPolicy(BasePolicy):
         if recipient in self.approved_recipients:
             return True
 
-        if recipient in self.temporary_entries:
-            expires_at = self.temporary_entries[recipient]
-            if current_time < expires_at:
-                return True
-            else:
-                del self.temporary_entries[recipient]
-
-        return False
+        self.purge_expired(current_time)
+        expires_at = self.temporary_entries.get(recipient)
+        return expires_at is not None and current_time < expires_at
 
     def validate(self, transaction: Transaction, context: Dict) -> None:
         if not self.enabled:
             return
-
-        current_time = context.get("current_time", datetime.now())
+        current_time = _context_time(context)
 
         if not self.is_recipient_approved(transaction.recipient, current_time):
             raise PolicyViolation(
@@ -156,8 +404,26 @@ class WhitelistPolicy(BasePolicy):
                 f"Recipient {transaction.recipient} is not whitelisted"
             )
 
+    def validate_batch(self, transactions: List[Transaction], amounts: List[float],
+                       recipients: List[str], context: Dict) -> None:
+        if not self.enabled:
+            return
+        current_time = _context_time(context)
+        self.purge_expired(current_time)
+        candidates = set(recipients)
+        temporary = self.temporary_entries
+        rejected = (candidates & self.blacklisted_recipients) | {
+            recipient for recipient in candidates - self.approved_recipients
+            if recipient not in temporary or temporary[recipient] <= current_time
+        }
+        if rejected:
+            recipient = next(r for r in recipients if r in rejected)
+            raise PolicyViolation(self.policy_id, f"Recipient {recipient} is not whitelisted")
+
 
 class CategoryPolicy(BasePolicy):
+    __slots__ = ("required_categories", "category_thresholds")
+
     def __init__(self, policy_id: str, enabled=True):
         super().__init__(policy_id, enabled)
         self.required_categories = set()
@@ -172,7 +438,6 @@ class CategoryPolicy(BasePolicy):
     def validate(self, transaction: Transaction, context: Dict) -> None:
         if not self.enabled:
             return
-
         category = context.get("category")
 
         if not category:
@@ -188,8 +453,17 @@ class CategoryPolicy(BasePolicy):
                 f"{[c.value for c in self.required_categories]}"
             )
 
+    def validate_batch(self, transactions: List[Transaction], amounts: List[float],
+                       recipients: List[str], context: Dict) -> None:
+        if not self.enabled:
+            return
+        self.validate(transactions[0], context)
+
 
 class TimeLockPolicy(BasePolicy):
+    __slots__ = ("base_lock_duration", "amount_factor")
+    context_only = True
+
     def __init__(self, policy_id: str, amount_factor: float = 1000.0, enabled=True):
         super().__init__(policy_id, enabled)
         self.base_lock_duration = {}
@@ -206,7 +480,6 @@ class TimeLockPolicy(BasePolicy):
     def validate(self, transaction: Transaction, context: Dict) -> None:
         if not self.enabled:
             return
-
         category = context.get("category", Category.OTHER)
         lock_duration = self.calculate_lock_duration(transaction.amount, category)
         context["required_time_lock"] = max(
@@ -214,119 +487,253 @@ class TimeLockPolicy(BasePolicy):
             lock_duration
         )
 
+    def validate_batch(self, transactions: List[Transaction], amounts: List[float],
+                       recipients: List[str], context: Dict) -> None:
+        if not self.enabled:
+            return
+        category = context.get("category", Category.OTHER)
+        context["required_time_lock"] = max(
+            context.get("required_time_lock", 0),
+            max(self.calculate_lock_duration(amount, category) for amount in amounts)
+        )
+
 
 class AmountThresholdPolicy(BasePolicy):
+    __slots__ = ("thresholds", "_mins", "_maxs", "_required", "_disjoint")
+    context_only = True
+
     def __init__(self, policy_id: str, enabled=True):
         super().__init__(policy_id, enabled)
         self.thresholds = []
+        self._mins: List[float] = []
+        self._maxs: List[float] = []
+        self._required: List[int] = []
+        self._disjoint = True
 
     def get_policy_type(self) -> str:
         return "amount_threshold"
 
     def add_threshold_range(self, min_amount: float, max_amount: float, required_threshold: int) -> None:
-        self.thresholds.append((min_amount, max_amount, required_threshold))
-        self.thresholds.sort(key=lambda x: x[0])
+        index = bisect.bisect_right(self._mins, min_amount)
+        self.thresholds.insert(index, (min_amount, max_amount, required_threshold))
+        self._mins.insert(index, min_amount)
+        self._maxs.insert(index, max_amount)
+        self._required.insert(index, required_threshold)
+        self._disjoint = all(
+            self._maxs[i] <= self._mins[i + 1] for i in range(len(self._mins) - 1)
+        )
 
     def get_required_threshold(self, amount: float) -> int:
-        for min_amt, max_amt, threshold in self.thresholds:
-            if min_amt <= amount < max_amt:
-                return threshold
-        return self.thresholds[-1][2] if self.thresholds else 2
+        if not self._required:
+            return 2
+        if self._disjoint:
+            index = bisect.bisect_right(self._mins, amount) - 1
+            if index >= 0 and amount < self._maxs[index]:
+                return self._required[index]
+        else:
+            for min_amt, max_amt, threshold in self.thresholds:
+                if min_amt <= amount < max_amt:
+                    return threshold
+        return self._required[-1]
 
     def validate(self, transaction: Transaction, context: Dict) -> None:
         if not self.enabled:
             return
-
         required_threshold = self.get_required_threshold(transaction.amount)
         context["required_threshold"] = max(
             context.get("required_threshold", 0),
             required_threshold
         )
 
+    def validate_batch(self, transactions: List[Transaction], amounts: List[float],
+                       recipients: List[str], context: Dict) -> None:
+        if not self.enabled:
+            return
+        context["required_threshold"] = max(
+            context.get("required_threshold", 0),
+            max(map(self.get_required_threshold, amounts))
+        )
+
 
 class ApprovalPolicy(BasePolicy):
+    __slots__ = ("required_signers_by_category", "veto_signers", "multi_tier_signers", "_required_by_id")
+
     def __init__(self, policy_id: str, enabled=True):
         super().__init__(policy_id, enabled)
         self.required_signers_by_category = {}
         self.veto_signers = set()
         self.multi_tier_signers = {}
+        self._required_by_id: Optional[Tuple[Optional[Set[str]], ...]] = None
 
     def get_policy_type(self) -> str:
         return "approval"
 
+    def seal(self) -> None:
+        required = [None] * len(_CATEGORY_IDS)
+        frozen = {
+            category: frozenset(signers)
+            for category, signers in self.required_signers_by_category.items()
+        }
+        for category, signers in frozen.items():
+            required[_CATEGORY_IDS[category]] = signers
+        self._required_by_id = tuple(required)
+        self.required_signers_by_category = MappingProxyType(frozen)
+        self.veto_signers = frozenset(self.veto_signers)
+        self.multi_tier_signers = MappingProxyType(dict(self.multi_tier_signers))
+        super().seal()
+
     def add_required_signer(self, category: Category, signer: str) -> None:
+        self._check_unsealed()
         if category not in self.required_signers_by_category:
             self.required_signers_by_category[category] = set()
         self.required_signers_by_category[category].add(signer)
 
     def add_veto_signer(self, signer: str) -> None:
+        self._check_unsealed()
         self.veto_signers.add(signer)
 
     def set_multi_tier(self, signer: str, tier_level: int) -> None:
+        self._check_unsealed()
         self.multi_tier_signers[signer] = tier_level
 
     def validate(self, transaction: Transaction, context: Dict) -> None:
         if not self.enabled:
             return
-
         category = context.get("category", Category.OTHER)
-        signatures = context.get("signatures", {})
-
-        if category in self.required_signers_by_category:
-            required = self.required_signers_by_category[category]
-            if not required.issubset(set(signatures.keys())):
-                missing = required - set(signatures.keys())
+        signer_keys = context.get("_signer_keys")
+        if signer_keys is None:
+            signer_keys = context.get("signatures", {}).keys()
+        if self._required_by_id is not None:
+            required = _by_category(self._required_by_id, category)
+        else:
+            required = self.required_signers_by_category.get(category)
+        if required:
+            missing = required - signer_keys
+            if missing:
                 raise PolicyViolation(
                     self.policy_id,
                     f"Missing required signers: {missing}"
                 )
 
-        for veto_signer in self.veto_signers:
-            if veto_signer in signatures:
+        if self.veto_signers:
+            veto_hit = self.veto_signers & signer_keys
+            if veto_hit:
                 raise PolicyViolation(
                     self.policy_id,
-                    f"Veto signer {veto_signer} cannot approve this proposal"
+                    f"Veto signer {min(veto_hit)} cannot approve this proposal"
                 )
 
+    def validate_batch(self, transactions: List[Transaction], amounts: List[float],
+                       recipients: List[str], context: Dict) -> None:
+        if not self.enabled:
+            return
+        self.validate(transactions[0], context)
+
 
 class PolicyManager:
+    __slots__ = (
+        "policies", "_by_type", "_validators", "_batch_validators",
+        "_execution_validators",
+    )
+
     def __init__(self):
         self.policies: Dict[str, BasePolicy] = {}
+        self._by_type: Dict[str, List[BasePolicy]] = {}
+        self._validators: Tuple = ()
+        self._batch_validators: Tuple = ()
+        self._execution_validators: Tuple = ()
+
+    # Every registered policy is dispatched; each validate returns early when
+    # its policy is disabled, so toggling policy.enabled directly takes effect.
+    def _refresh_validators(self) -> None:
+        policies = tuple(self.policies.values())
+        self._validators = tuple(policy.validate for policy in policies)
+        self._batch_validators = tuple(policy.validate_batch for policy in policies)
+        self._execution_validators = tuple(
+            policy.validate_batch for policy in policies if not policy.context_only
+        )
 
     def add_policy(self, policy: BasePolicy) -> None:
+        self.remove_policy(policy.policy_id)
         self.policies[policy.policy_id] = policy
+        self._by_type.setdefault(policy.get_policy_type(), []).append(policy)
+        self._refresh_validators()
 
     def remove_policy(self, policy_id: str) -> None:
-        self.policies.pop(policy_id, None)
+        policy = self.policies.pop(policy_id, None)
+        if policy is not None:
+            self._by_type[policy.get_policy_type()].remove(policy)
+            self._refresh_validators()
 
     def get_policy(self, policy_id: str) -> Optional[BasePolicy]:
         return self.policies.get(policy_id)
 
+    def get_policies_by_type(self, policy_type: str) -> List[BasePolicy]:
+        return list(self._by_type.get(policy_type, ()))
+
+    def get_whitelist_policies(self) -> List[WhitelistPolicy]:
+        return self.get_policies_by_type("whitelist")
+
     def validate_transaction(self, transaction: Transaction, context: Dict) -> None:
-        for policy in self.policies.values():
-            policy.validate(transaction, context)
+        internal = _prepare_context(context)
+        for validate in self._validators:
+            validate(transaction, internal)
+        _publish_context(context, internal)
 
     def validate_all_transactions(self, transactions: List[Transaction], context: Dict) -> None:
-        for transaction in transactions:
-            self.validate_transaction(transaction, context)
+        if not transactions:
+            return
+        internal = _prepare_context(context)
+        amounts = [t.amount for t in transactions]
+        recipients = [t.recipient for t in transactions]
+        for validate_batch in self._batch_validators:
+            validate_batch(transactions, amounts, recipients, internal)
+        _publish_context(context, internal)
+
+    def validate_for_execution(self, transactions: List[Transaction], context: Dict) -> None:
+        if not transactions or not self._execution_validators:
+            return
+        internal = _prepare_context(context)
+        amounts = [t.amount for t in transactions]
+        recipients = [t.recipient for t in transactions]
+        for validate_batch in self._execution_validators:
+            validate_batch(transactions, amounts, recipients, internal)
+        _publish_context(context, internal)
 
     def get_required_time_lock(self, transactions: List[Transaction], category: Category) -> int:
         context = {"category": category, "required_time_lock": 0}
+        lock_policies = [p for p in self._by_type.get("timelock", ()) if p.enabled]
         for transaction in transactions:
-            for policy in self.policies.values():
-                if isinstance(policy, TimeLockPolicy):
-                    policy.validate(transaction, context)
+            for policy in lock_policies:
+                policy.validate(transaction, context)
         return context.get("required_time_lock", 0)
 
     def get_required_threshold(self, transactions: List[Transaction]) -> int:
         context = {"required_threshold": 0}
+        if max((t.amount for t in transactions), default=0) <= 0:
+            return context["required_threshold"]
+        threshold_policies = [p for p in self._by_type.get("amount_threshold", ()) if p.enabled]
         for transaction in transactions:
-            max_amount = max(t.amount for t in transactions) if transactions else 0
-            if max_amount > 0:
-                for policy in self.policies.values():
-                    if isinstance(policy, AmountThresholdPolicy):
-                        policy.validate(transaction, context)
+            for policy in threshold_policies:
+                policy.validate(transaction, context)
         return context.get("required_threshold", 2)
 
-    def list_policies(self) -> List[str]:
-        return list(self.policies.keys())
+    def required_limits(self, transactions: List[Transaction], category: Category) -> Tuple[int, int]:
+        context = {"category": category, "required_threshold": 0, "required_time_lock": 0}
+        if not transactions:
+            return 0, 0
+        amounts = [t.amount for t in transactions]
+        for policy in self._by_type.get("timelock", ()):
+            if policy.enabled:
+                policy.validate_batch(transactions, amounts, (), context)
+        if max(amounts) > 0:
+            for policy in self._by_type.get("amount_threshold", ()):
+                if policy.enabled:
+                    policy.validate_batch(transactions, amounts, (), context)
+        return context["required_threshold"], context["required_time_lock"]
+
+    def list_policies(self) -> KeysView[str]:
+        return self.policies.keys()
+
+    def list_policies_snapshot(self) -> Tuple[str, ...]:
+        return tuple(self.policies)
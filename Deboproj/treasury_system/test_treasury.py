@@ -1,20 +1,75 @@
+import copy
+import functools
+import hashlib
+import os
+import pickle
 import unittest
+from unittest import mock
 from datetime import datetime, timedelta
+from sys import intern
+from types import MappingProxyType
 from .models import (
     Transaction, TransactionType, Category, Proposal, ProposalStatus,
-    TreasuryBalance, PeriodType
+    PeriodType, Signature, SignatureSet, SpendingRecord, batch_compute_hashes
 )
 from .policies import (
-    SpendingLimitPolicy, WhitelistPolicy, CategoryPolicy, TimeLockPolicy,
+    BasePolicy, SpendingLimitPolicy, WhitelistPolicy, CategoryPolicy, TimeLockPolicy,
     AmountThresholdPolicy, ApprovalPolicy, PolicyViolation, PolicyManager
 )
-from .treasury import Treasury
+from .treasury import (
+    AUDIT_DETAIL_BASIC, AUDIT_LOG_BUFFER_SIZE, Treasury, TreasuryAuditLog
+)
 from .emergency import EmergencyModule
 
 
+_NOW = datetime(2024, 1, 1, 12, 0, 0)
+
+QUICK = os.environ.get("TREASURY_QUICK_TESTS") == "1"
+
+
+@functools.lru_cache(maxsize=None)
+def _tx(amount: float, recipient: str = "recipient1", tx_id: str = "tx1") -> Transaction:
+    return Transaction(
+        tx_id=tx_id,
+        tx_type=TransactionType.TRANSFER,
+        recipient=recipient,
+        amount=amount,
+        coin_type="SUI"
+    )
+
+
+_SIGNERS_5 = frozenset(("signer1", "signer2", "signer3", "signer4", "signer5"))
+_SIGNERS_3 = frozenset(("signer1", "signer2", "signer3"))
+_ESIGNERS = frozenset(("esigner1", "esigner2", "esigner3"))
+
+_OVERSIZED_TXS = tuple(
+    Transaction(
+        tx_id=intern(f"tx{i}"),
+        tx_type=TransactionType.TRANSFER,
+        recipient=intern(f"recipient{i}"),
+        amount=10.0,
+        coin_type="SUI"
+    )
+    for i in range(51)
+)
+
+
+class _MaxAmountPolicy(BasePolicy):
+    def __init__(self, policy_id: str, cap: float):
+        super().__init__(policy_id)
+        self.cap = cap
+
+    def get_policy_type(self) -> str:
+        return "max_amount"
+
+    def validate(self, transaction, context):
+        if transaction.amount > self.cap:
+            raise PolicyViolation(self.policy_id, f"Amount {transaction.amount} exceeds {self.cap}")
+
+
 class TestTreasuryCreation(unittest.TestCase):
     def setUp(self):
-        self.signers = {"signer1", "signer2", "signer3", "signer4", "signer5"}
+        self.signers = _SIGNERS_5
         self.treasury = Treasury(
             treasury_id="test_treasury",
             signers=self.signers,
@@ -38,6 +93,11 @@ class TestTreasuryCreation(unittest.TestCase):
         self.treasury.deposit("SUI", 1000.0, "signer1")
         self.assertEqual(self.treasury.get_balance("SUI"), 1000.0)
 
+    def test_deposit_records_current_time(self):
+        current_time = datetime(2024, 1, 1, 12, 0, 0)
+        self.treasury.deposit("SUI", 1000.0, "signer1", current_time=current_time)
+        self.assertEqual(self.treasury.balances["SUI"].last_updated, current_time)
+
     def test_deposit_negative_amount(self):
         with self.assertRaises(ValueError):
             self.treasury.deposit("SUI", -100.0, "signer1")
@@ -47,25 +107,42 @@ class TestTreasuryCreation(unittest.TestCase):
         self.treasury.deposit("USDC", 5000.0, "signer1")
         self.assertEqual(self.treasury.get_balance("SUI"), 1000.0)
         self.assertEqual(self.treasury.get_balance("USDC"), 5000.0)
+        self.assertEqual(self.treasury.get_balance("WETH"), 0.0)
+        self.assertEqual(self.treasury.get_all_balances(), {"SUI": 1000.0, "USDC": 5000.0})
+
+    def test_balances_view_is_read_only(self):
+        self.treasury.deposit("SUI", 1000.0, "signer1")
+        balances = self.treasury.balances
+        with self.assertRaises(AttributeError):
+            balances["SUI"].deposit(500.0, _NOW)
+        with self.assertRaises(AttributeError):
+            balances["SUI"].amount = 0.0
+        with self.assertRaises(TypeError):
+            balances["USDC"] = balances["SUI"]
+        self.assertEqual(self.treasury.get_balance("SUI"), 1000.0)
+
+        self.treasury.deposit("SUI", 500.0, "signer1")
+        self.treasury.deposit("USDC", 5.0, "signer1")
+        self.assertEqual(balances["SUI"].amount, 1500.0)
+        self.assertIn("USDC", balances)
 
 
 class TestProposalCreation(unittest.TestCase):
-    def setUp(self):
-        self.signers = {"signer1", "signer2", "signer3", "signer4", "signer5"}
-        self.treasury = Treasury(
+    @classmethod
+    def setUpClass(cls):
+        cls.signers = _SIGNERS_5
+        cls._template_treasury = Treasury(
             treasury_id="test_treasury",
-            signers=self.signers,
+            signers=cls.signers,
             threshold=3
         )
-        self.treasury.deposit("SUI", 10000.0, "signer1")
+        cls._template_treasury.deposit("SUI", 10000.0, "signer1")
 
-        self.transaction = Transaction(
-            tx_id="tx1",
-            tx_type=TransactionType.TRANSFER,
-            recipient="recipient1",
-            amount=100.0,
-            coin_type="SUI"
-        )
+        cls._template_tx = _tx(100.0)
+
+    def setUp(self):
+        self.treasury = copy.deepcopy(self._template_treasury)
+        self.transaction = self._template_tx
 
     def test_create_proposal_valid(self):
         proposal_id = self.treasury.create_proposal(
@@ -77,6 +154,52 @@ class TestProposalCreation(unittest.TestCase):
         self.assertIsNotNone(proposal_id)
         self.assertEqual(self.treasury.get_proposal(proposal_id).status, ProposalStatus.TIME_LOCKED)
 
+    def test_list_proposals_by_status(self):
+        proposal_ids = [
+            self.treasury.create_proposal(
+                creator="signer1",
+                transactions=[self.transaction],
+                category=Category.OPERATIONS,
+                description=f"Test proposal {i}"
+            )
+            for i in range(3)
+        ]
+        self.treasury.cancel_proposal(proposal_ids[1], "signer1")
+
+        self.assertEqual(
+            self.treasury.list_proposals(ProposalStatus.TIME_LOCKED),
+            [proposal_ids[0], proposal_ids[2]]
+        )
+        self.assertEqual(self.treasury.list_proposals(ProposalStatus.CANCELLED), [proposal_ids[1]])
+        self.assertEqual(self.treasury.list_proposals(), proposal_ids)
+        self.assertEqual(self.treasury.get_treasury_state()["active_proposals"], 2)
+
+    def test_create_proposal_checks_balances_before_policies(self):
+        self.treasury.policy_manager.add_policy(WhitelistPolicy(policy_id="wl"))
+        overdraft = [_tx(6000.0), _tx(5000.0, recipient="recipient2", tx_id="tx2")]
+        unknown_coin = [Transaction(
+            tx_id="tx3",
+            tx_type=TransactionType.TRANSFER,
+            recipient="recipient1",
+            amount=1.0,
+            coin_type="USDC"
+        )]
+        invalid_amount = [_tx(100.0), _tx(-5.0, tx_id="tx2")]
+        for transactions, message in (
+            (overdraft, "Insufficient balance"),
+            (unknown_coin, "No balance"),
+            (invalid_amount, r"Transaction amounts must be positive \(SUI\)"),
+        ):
+            with self.subTest(message=message):
+                with self.assertRaisesRegex(ValueError, message):
+                    self.treasury.create_proposal(
+                        creator="signer1",
+                        transactions=transactions,
+                        category=Category.OPERATIONS,
+                        description="Test proposal"
+                    )
+        self.assertEqual(self.treasury.list_proposals(), [])
+
     def test_create_proposal_non_signer(self):
         with self.assertRaises(PermissionError):
             self.treasury.create_proposal(
@@ -96,101 +219,180 @@ class TestProposalCreation(unittest.TestCase):
             )
 
     def test_create_proposal_too_many_transactions(self):
-        transactions = [
-            Transaction(
-                tx_id=f"tx{i}",
-                tx_type=TransactionType.TRANSFER,
-                recipient=f"recipient{i}",
-                amount=10.0,
-                coin_type="SUI"
-            )
-            for i in range(51)
-        ]
-
         with self.assertRaises(ValueError):
             self.treasury.create_proposal(
                 creator="signer1",
-                transactions=transactions,
+                transactions=list(_OVERSIZED_TXS),
                 category=Category.OPERATIONS,
                 description="Test proposal"
             )
 
 
 class TestMultiSig(unittest.TestCase):
-    def setUp(self):
-        self.signers = {"signer1", "signer2", "signer3", "signer4", "signer5"}
-        self.treasury = Treasury(
+    @classmethod
+    def setUpClass(cls):
+        cls.signers = _SIGNERS_5
+        cls._template_treasury = Treasury(
             treasury_id="test_treasury",
-            signers=self.signers,
+            signers=cls.signers,
             threshold=3
         )
-        self.treasury.deposit("SUI", 10000.0, "signer1")
+        cls._template_treasury.deposit("SUI", 10000.0, "signer1")
 
-        self.transaction = Transaction(
-            tx_id="tx1",
-            tx_type=TransactionType.TRANSFER,
-            recipient="recipient1",
-            amount=100.0,
-            coin_type="SUI"
-        )
+        cls._template_tx = _tx(100.0)
 
-        self.proposal_id = self.treasury.create_proposal(
+        cls.proposal_id = cls._template_treasury.create_proposal(
             creator="signer1",
-            transactions=[self.transaction],
+            transactions=[cls._template_tx],
             category=Category.OPERATIONS,
             description="Test proposal"
         )
+        cls._snapshot = cls._template_treasury.snapshot()
 
-    def test_sign_proposal(self):
-        self.treasury.sign_proposal(
-            proposal_id=self.proposal_id,
-            signer="signer1",
-            signature="sig1"
-        )
-        proposal = self.treasury.get_proposal(self.proposal_id)
-        self.assertEqual(len(proposal.signatures), 1)
-
-    def test_sign_proposal_non_signer(self):
-        with self.assertRaises(PermissionError):
-            self.treasury.sign_proposal(
+    def setUp(self):
+        self.treasury = Treasury.restore(self._snapshot)
+        self.transaction = self._template_tx
+
+    def test_multisig_flows(self):
+        # The subtests walk one proposal through its lifecycle on the
+        # treasury restored in setUp.
+        treasury = self.treasury
+        with self.subTest("sign_ok"):
+            treasury.sign_proposal(
                 proposal_id=self.proposal_id,
-                signer="non_signer",
+                signer="signer1",
                 signature="sig1"
             )
-
-    def test_sign_proposal_duplicate_signature(self):
-        self.treasury.sign_proposal(
-            proposal_id=self.proposal_id,
-            signer="signer1",
-            signature="sig1"
-        )
-        with self.assertRaises(ValueError):
-            self.treasury.sign_proposal(
+            proposal = treasury.get_proposal(self.proposal_id)
+            self.assertEqual(len(proposal.signatures), 1)
+            self.assertEqual(proposal.get_signature_count(), 1)
+
+        with self.subTest("sign_non_signer"):
+            with self.assertRaises(PermissionError):
+                treasury.sign_proposal(
+                    proposal_id=self.proposal_id,
+                    signer="non_signer",
+                    signature="sig1"
+                )
+
+        with self.subTest("sign_duplicate"):
+            with self.assertRaises(ValueError):
+                treasury.sign_proposal(
+                    proposal_id=self.proposal_id,
+                    signer="signer1",
+                    signature="sig2"
+                )
+
+        with self.subTest("execute_before_threshold"):
+            treasury.sign_proposal(
                 proposal_id=self.proposal_id,
-                signer="signer1",
+                signer="signer2",
                 signature="sig2"
             )
+            with self.assertRaises(ValueError):
+                treasury.execute_proposal(
+                    proposal_id=self.proposal_id,
+                    executor="signer1"
+                )
+
+    def test_restore_is_independent_of_template(self):
+        self.treasury.sign_proposal(self.proposal_id, "signer1", "sig1")
+        restored = Treasury.restore(self._snapshot)
+        self.assertEqual(len(restored.get_proposal(self.proposal_id).signatures), 0)
+        self.assertEqual(restored.get_balance("SUI"), 10000.0)
+        restored.sign_proposal(self.proposal_id, "signer1", "sig1")
+
+    def test_restore_rejects_non_treasury_snapshot(self):
+        with self.assertRaises(TypeError):
+            Treasury.restore(pickle.dumps({"treasury_id": "forged"}))
+
+    def test_proposal_hash_cached_across_signatures(self):
+        with mock.patch(f"{Treasury.__module__}.batch_compute_hashes", wraps=batch_compute_hashes) as compute:
+            self.treasury.sign_proposal(self.proposal_id, "signer1", "sig1")
+            self.treasury.sign_proposal(self.proposal_id, "signer2", "sig2")
+        self.assertEqual(compute.call_count, 1)
+        proposal = self.treasury.get_proposal(self.proposal_id)
+        self.assertEqual(proposal.signatures["signer1"].tx_hash, proposal.signatures["signer2"].tx_hash)
+
+    def test_proposal_hash_is_unsalted_digest(self):
+        self.treasury.sign_proposal(self.proposal_id, "signer1", "sig1")
+        pid = self.proposal_id.encode()
+        expected = hashlib.blake2b(
+            len(pid).to_bytes(4, "big") + pid
+            + self.transaction.compute_hash_bytes()
+            + len(b"operations").to_bytes(4, "big") + b"operations",
+            digest_size=16
+        ).hexdigest()
+        proposal = self.treasury.get_proposal(self.proposal_id)
+        self.assertEqual(proposal.signatures["signer1"].tx_hash, expected)
 
-    def test_execute_proposal_before_threshold(self):
-        self.treasury.sign_proposal(
-            proposal_id=self.proposal_id,
-            signer="signer1",
-            signature="sig1"
+    def test_execute_validates_before_withdrawing(self):
+        proposal_id = self.treasury.create_proposal(
+            creator="signer1",
+            transactions=[_tx(100.0), _tx(200.0, recipient="recipient2", tx_id="tx2")],
+            category=Category.OPERATIONS,
+            description="Two recipients",
+            current_time=_NOW
         )
-        self.treasury.sign_proposal(
-            proposal_id=self.proposal_id,
-            signer="signer2",
-            signature="sig2"
+        for i in range(1, 4):
+            self.treasury.sign_proposal(proposal_id, f"signer{i}", f"sig{i}", current_time=_NOW)
+
+        whitelist = WhitelistPolicy(policy_id="late_whitelist")
+        whitelist.add_recipient("recipient1")
+        self.treasury.policy_manager.add_policy(whitelist)
+
+        with self.assertRaises(PolicyViolation):
+            self.treasury.execute_proposal(proposal_id, "signer1", _NOW + timedelta(hours=2))
+        self.assertEqual(self.treasury.get_balance("SUI"), 10000.0)
+        self.assertEqual(self.treasury.get_spending_history(), [])
+
+    def test_unexpected_policy_error_marks_proposal_failed(self):
+        class _BrokenPolicy(BasePolicy):
+            def get_policy_type(self) -> str:
+                return "broken"
+
+            def validate(self, transaction, context):
+                raise ValueError("policy backend unavailable")
+
+        for i in range(1, 4):
+            self.treasury.sign_proposal(self.proposal_id, f"signer{i}", f"sig{i}")
+        self.treasury.policy_manager.add_policy(_BrokenPolicy("broken"))
+        with self.assertRaisesRegex(ValueError, "policy backend unavailable"):
+            self.treasury.execute_proposal(self.proposal_id, "signer1", datetime.now() + timedelta(hours=2))
+        self.assertEqual(self.treasury.get_proposal(self.proposal_id).status, ProposalStatus.FAILED)
+        self.assertEqual(self.treasury.get_audit_logs()[-1].action, "execute_proposal_failed")
+        self.assertEqual(self.treasury.get_balance("SUI"), 10000.0)
+
+    def test_execute_rechecks_funding(self):
+        overdraft_id = self.treasury.create_proposal(
+            creator="signer1",
+            transactions=[_tx(9950.0, tx_id="tx9")],
+            category=Category.OPERATIONS,
+            description="Fits at creation only"
         )
+        for proposal_id in (self.proposal_id, overdraft_id):
+            for i in range(1, 4):
+                self.treasury.sign_proposal(proposal_id, f"signer{i}", f"sig{i}")
+
+        execution_time = datetime.now() + timedelta(hours=2)
+        self.treasury.execute_proposal(self.proposal_id, "signer1", execution_time)
+        with self.assertRaisesRegex(ValueError, "Insufficient balance for SUI"):
+            self.treasury.execute_proposal(overdraft_id, "signer1", execution_time)
+        self.assertEqual(self.treasury.get_proposal(overdraft_id).status, ProposalStatus.FAILED)
+        self.assertEqual(self.treasury.get_balance("SUI"), 9900.0)
 
-        with self.assertRaises(ValueError):
-            self.treasury.execute_proposal(
-                proposal_id=self.proposal_id,
-                executor="signer1"
-            )
+    def test_new_signer_gets_distinct_bit(self):
+        self.treasury.add_signer("signer6", "signer1")
+        self.treasury.sign_proposal(self.proposal_id, "signer1", "sig1")
+        self.treasury.sign_proposal(self.proposal_id, "signer6", "sig6")
+        proposal = self.treasury.get_proposal(self.proposal_id)
+        self.assertEqual(proposal.signer_mask.bit_count(), 2)
+        config = self.treasury.config
+        self.assertEqual(len({config.signer_bit(s) for s in config.signer_keys}), 6)
 
+    @unittest.skipIf(QUICK, "full execution path; unset TREASURY_QUICK_TESTS to run")
     def test_execute_proposal_success(self):
-        current_time = datetime.now()
+        current_time = _NOW
         proposal_id = self.treasury.create_proposal(
             creator="signer1",
             transactions=[self.transaction],
@@ -228,51 +430,53 @@ class TestMultiSig(unittest.TestCase):
         proposal = self.treasury.get_proposal(proposal_id)
         self.assertEqual(proposal.status, ProposalStatus.EXECUTED)
         self.assertEqual(self.treasury.get_balance("SUI"), 9900.0)
+        self.assertTrue(proposal.has_quorum())
+        self.assertEqual(self.treasury.get_total_spending(), 100.0)
+        self.assertEqual(self.treasury.get_total_spending(Category.OPERATIONS), 100.0)
+        self.assertEqual(self.treasury.get_total_spending(Category.MARKETING), 0.0)
+        self.assertEqual(
+            self.treasury.get_spending_history(Category.OPERATIONS),
+            self.treasury.get_spending_history()
+        )
+        self.assertEqual(self.treasury.get_spending_history(Category.MARKETING), [])
+        self.assertEqual(self.treasury.get_treasury_state()["total_spending"], 100.0)
+
+        self.assertEqual(self.treasury.get_spending_history("operations"), self.treasury.get_spending_history())
+        self.assertEqual(self.treasury.list_proposals("executed"), [proposal_id])
+        self.assertEqual(self.treasury.list_proposals("unknown"), [])
+        self.treasury.get_spending_history(Category.OPERATIONS).clear()
+        self.assertEqual(len(self.treasury.get_spending_history(Category.OPERATIONS)), 1)
 
 
 class TestSpendingLimitPolicy(unittest.TestCase):
-    def setUp(self):
-        self.policy = SpendingLimitPolicy(
+    @classmethod
+    def setUpClass(cls):
+        policy = SpendingLimitPolicy(
             policy_id="limit1",
             period_type=PeriodType.DAILY,
             global_limit=5000.0,
             max_per_transaction=1000.0
         )
-        self.policy.limit_per_category[Category.OPERATIONS] = 2000.0
-        self.policy.limit_per_category[Category.MARKETING] = 1000.0
+        policy.limit_per_category[Category.OPERATIONS] = 2000.0
+        policy.limit_per_category[Category.MARKETING] = 1000.0
+        cls._policy_template = policy
+
+    def setUp(self):
+        self.policy = copy.deepcopy(self._policy_template)
 
     def test_max_per_transaction_validation(self):
-        transaction = Transaction(
-            tx_id="tx1",
-            tx_type=TransactionType.TRANSFER,
-            recipient="recipient1",
-            amount=1500.0,
-            coin_type="SUI"
-        )
+        transaction = _tx(1500.0)
 
         with self.assertRaises(PolicyViolation):
             self.policy.validate(
                 transaction,
-                {"category": Category.OPERATIONS, "current_time": datetime.now()}
+                {"category": Category.OPERATIONS, "current_time": _NOW}
             )
 
     def test_category_limit_validation(self):
-        from .models import SpendingRecord
-        current_time = datetime.now()
-        transaction1 = Transaction(
-            tx_id="tx1",
-            tx_type=TransactionType.TRANSFER,
-            recipient="recipient1",
-            amount=1500.0,
-            coin_type="SUI"
-        )
-        transaction2 = Transaction(
-            tx_id="tx2",
-            tx_type=TransactionType.TRANSFER,
-            recipient="recipient2",
-            amount=800.0,
-            coin_type="SUI"
-        )
+        current_time = _NOW
+        transaction1 = _tx(1500.0)
+        transaction2 = _tx(800.0, "recipient2", "tx2")
 
         record1 = SpendingRecord(
             amount=1500.0,
@@ -290,8 +494,7 @@ class TestSpendingLimitPolicy(unittest.TestCase):
             )
 
     def test_global_limit_validation(self):
-        from .models import SpendingRecord
-        current_time = datetime.now()
+        current_time = _NOW
         record1 = SpendingRecord(
             amount=4500.0,
             timestamp=current_time,
@@ -301,13 +504,7 @@ class TestSpendingLimitPolicy(unittest.TestCase):
         )
         self.policy.add_spending_record(record1)
 
-        transaction = Transaction(
-            tx_id="tx1",
-            tx_type=TransactionType.TRANSFER,
-            recipient="recipient1",
-            amount=700.0,
-            coin_type="SUI"
-        )
+        transaction = _tx(700.0)
 
         with self.assertRaises(PolicyViolation):
             self.policy.validate(
@@ -315,6 +512,77 @@ class TestSpendingLimitPolicy(unittest.TestCase):
                 {"category": Category.OPERATIONS, "current_time": current_time}
             )
 
+    def test_period_totals_across_days(self):
+        today = datetime(2024, 1, 10, 12, 0)
+        yesterday = today - timedelta(days=1)
+        for amount, timestamp in ((300.0, yesterday), (200.0, today), (100.0, today)):
+            self.policy.add_spending_record(SpendingRecord(
+                amount=amount,
+                timestamp=timestamp,
+                category=Category.OPERATIONS,
+                proposal_id="p1",
+                tx_hash="hash1"
+            ))
+
+        self.assertEqual(self.policy.get_current_spending(Category.OPERATIONS, today), 300.0)
+        self.assertEqual(self.policy.get_global_spending(today), 300.0)
+        self.assertEqual(self.policy.get_current_spending(Category.MARKETING, today), 0.0)
+        self.assertEqual(self.policy.get_global_spending(yesterday), 600.0)
+        self.assertEqual(self.policy.get_current_spending(Category.OPERATIONS, yesterday), 600.0)
+
+    def test_spending_history_keeps_original_records(self):
+        records = [
+            SpendingRecord(300.0, datetime(2024, 1, 9, 12, 0, 0, 250000), Category.OPERATIONS, "p1", "hash1"),
+            SpendingRecord(200.0, datetime(2024, 1, 10, 12, 0), Category.MARKETING, "p2", "hash2"),
+        ]
+        for record in records:
+            self.policy.add_spending_record(record)
+
+        self.assertEqual(self.policy.spending_history, records)
+        self.assertIs(self.policy.spending_history[0], records[0])
+
+    def test_sealed_policy_limits(self):
+        current_time = _NOW
+        self.policy.add_spending_record(SpendingRecord(
+            amount=900.0,
+            timestamp=current_time,
+            category=Category.MARKETING,
+            proposal_id="p1",
+            tx_hash="hash1"
+        ))
+        self.policy.seal()
+        self.assertTrue(self.policy.is_sealed())
+        with self.assertRaises(TypeError):
+            self.policy.limit_per_category[Category.OTHER] = 1.0
+
+        transaction = _tx(200.0)
+        context = {"category": Category.MARKETING, "current_time": current_time}
+        restored = pickle.loads(pickle.dumps(self.policy))
+        for policy in (self.policy, restored):
+            with self.subTest(restored=policy is restored):
+                with self.assertRaises(PolicyViolation):
+                    policy.validate(transaction, context)
+                policy.validate(transaction, {"category": Category.RESEARCH, "current_time": current_time})
+        self.assertTrue(restored.is_sealed())
+
+    def test_spending_scan_after_pruning(self):
+        today = datetime(2024, 1, 10, 12, 0)
+        yesterday = today - timedelta(days=1)
+        records = (
+            (100.0, yesterday, Category.OPERATIONS),
+            (200.0, yesterday, Category.MARKETING),
+            (300.0, today, Category.OPERATIONS),
+            (400.0, today, Category.MARKETING),
+        )
+        for amount, timestamp, category in records:
+            self.policy.add_spending_record(SpendingRecord(amount, timestamp, category, "p1", "hash1"))
+
+        # Querying today prunes the running totals, so yesterday is answered by the column scan.
+        self.assertEqual(self.policy.get_global_spending(today), 700.0)
+        self.assertEqual(self.policy.get_global_spending(yesterday), 1000.0)
+        self.assertEqual(self.policy.get_current_spending(Category.OPERATIONS, yesterday), 400.0)
+        self.assertEqual(self.policy.get_current_spending(Category.MARKETING, yesterday), 600.0)
+
 
 class TestWhitelistPolicy(unittest.TestCase):
     def setUp(self):
@@ -323,56 +591,83 @@ class TestWhitelistPolicy(unittest.TestCase):
         self.policy.add_recipient("recipient2")
 
     def test_approved_recipient_validation(self):
-        transaction = Transaction(
-            tx_id="tx1",
-            tx_type=TransactionType.TRANSFER,
-            recipient="recipient1",
-            amount=100.0,
-            coin_type="SUI"
-        )
+        transaction = _tx(100.0)
 
-        self.policy.validate(transaction, {"current_time": datetime.now()})
+        self.policy.validate(transaction, {"current_time": _NOW})
 
     def test_unapproved_recipient_validation(self):
-        transaction = Transaction(
-            tx_id="tx1",
-            tx_type=TransactionType.TRANSFER,
-            recipient="unknown_recipient",
-            amount=100.0,
-            coin_type="SUI"
-        )
+        transaction = _tx(100.0, "unknown_recipient")
 
         with self.assertRaises(PolicyViolation):
-            self.policy.validate(transaction, {"current_time": datetime.now()})
+            self.policy.validate(transaction, {"current_time": _NOW})
 
     def test_temporary_recipient_validation(self):
-        current_time = datetime.now()
+        current_time = _NOW
         expiry = current_time + timedelta(hours=1)
         self.policy.add_temporary_recipient("temp_recipient", expiry)
 
+        transaction = _tx(100.0, "temp_recipient")
+
+        self.policy.validate(transaction, {"current_time": current_time})
+
+    def test_recipients_interned(self):
+        address = "".join(["0x", "ab" * 32])
+        self.policy.add_recipient(address)
         transaction = Transaction(
             tx_id="tx1",
             tx_type=TransactionType.TRANSFER,
-            recipient="temp_recipient",
+            recipient="".join(["0x", "ab" * 32]),
             amount=100.0,
             coin_type="SUI"
         )
+        stored = next(r for r in self.policy.approved_recipients if r == address)
+        self.assertIs(transaction.recipient, stored)
 
-        self.policy.validate(transaction, {"current_time": current_time})
+    def test_sealed_whitelist(self):
+        self.policy.blacklist_recipient("blocked")
+        self.policy.seal()
+        self.assertIsInstance(self.policy.approved_recipients, frozenset)
+        with self.assertRaises(RuntimeError):
+            self.policy.add_recipient("recipient2")
+        with self.assertRaises(RuntimeError):
+            self.policy.remove_recipient("recipient1")
+
+        current_time = _NOW
+        self.policy.add_temporary_recipient("temp", current_time + timedelta(hours=1))
+        self.assertTrue(self.policy.is_recipient_approved("recipient1", current_time))
+        self.assertTrue(self.policy.is_recipient_approved("temp", current_time))
+        self.assertFalse(self.policy.is_recipient_approved("blocked", current_time))
+
+    def test_expired_temporary_entries_purged(self):
+        current_time = datetime(2024, 1, 1, 12, 0)
+        self.policy.add_temporary_recipient("stale", current_time - timedelta(minutes=5))
+        self.policy.add_temporary_recipient("renewed", current_time - timedelta(minutes=1))
+        self.policy.add_temporary_recipient("renewed", current_time + timedelta(hours=1))
+
+        self.assertFalse(self.policy.is_recipient_approved("other", current_time))
+        self.assertNotIn("stale", self.policy.temporary_entries)
+        self.assertTrue(self.policy.is_recipient_approved("renewed", current_time))
+        self.assertFalse(
+            self.policy.is_recipient_approved("renewed", current_time + timedelta(hours=1))
+        )
+
+    def test_directly_added_temporary_entry_expires(self):
+        current_time = _NOW
+        self.policy.temporary_entries["direct"] = current_time - timedelta(days=1)
+        self.assertFalse(self.policy.is_recipient_approved("direct", current_time))
+        with self.assertRaises(PolicyViolation):
+            self.policy.validate_batch(
+                [_tx(10.0, "direct")], [10.0], ["direct"],
+                {"category": Category.OPERATIONS, "current_time": current_time}
+            )
 
     def test_blacklist_validation(self):
         self.policy.blacklist_recipient("recipient1")
 
-        transaction = Transaction(
-            tx_id="tx1",
-            tx_type=TransactionType.TRANSFER,
-            recipient="recipient1",
-            amount=100.0,
-            coin_type="SUI"
-        )
+        transaction = _tx(100.0)
 
         with self.assertRaises(PolicyViolation):
-            self.policy.validate(transaction, {"current_time": datetime.now()})
+            self.policy.validate(transaction, {"current_time": _NOW})
 
 
 class TestCategoryPolicy(unittest.TestCase):
@@ -381,13 +676,7 @@ class TestCategoryPolicy(unittest.TestCase):
         self.policy.required_categories = {Category.OPERATIONS, Category.MARKETING}
 
     def test_valid_category_validation(self):
-        transaction = Transaction(
-            tx_id="tx1",
-            tx_type=TransactionType.TRANSFER,
-            recipient="recipient1",
-            amount=100.0,
-            coin_type="SUI"
-        )
+        transaction = _tx(100.0)
 
         self.policy.validate(
             transaction,
@@ -395,13 +684,7 @@ class TestCategoryPolicy(unittest.TestCase):
         )
 
     def test_invalid_category_validation(self):
-        transaction = Transaction(
-            tx_id="tx1",
-            tx_type=TransactionType.TRANSFER,
-            recipient="recipient1",
-            amount=100.0,
-            coin_type="SUI"
-        )
+        transaction = _tx(100.0)
 
         with self.assertRaises(PolicyViolation):
             self.policy.validate(
@@ -410,56 +693,84 @@ class TestCategoryPolicy(unittest.TestCase):
             )
 
     def test_missing_category_validation(self):
-        transaction = Transaction(
-            tx_id="tx1",
-            tx_type=TransactionType.TRANSFER,
-            recipient="recipient1",
-            amount=100.0,
-            coin_type="SUI"
-        )
+        transaction = _tx(100.0)
 
         with self.assertRaises(PolicyViolation):
             self.policy.validate(transaction, {})
 
 
 class TestTimeLockPolicy(unittest.TestCase):
-    def setUp(self):
-        self.policy = TimeLockPolicy(policy_id="timelock1")
-        self.policy.base_lock_duration[Category.OPERATIONS] = 3600
-        self.policy.base_lock_duration[Category.MARKETING] = 7200
-        self.policy.amount_factor = 1000.0
-
-    def test_calculate_lock_duration_small_amount(self):
-        duration = self.policy.calculate_lock_duration(500.0, Category.OPERATIONS)
-        self.assertEqual(duration, 3600)
-
-    def test_calculate_lock_duration_large_amount(self):
-        duration = self.policy.calculate_lock_duration(5000.0, Category.OPERATIONS)
-        expected = 3600 + (5000 / 1000) * 3600
-        self.assertEqual(duration, int(expected))
+    @classmethod
+    def setUpClass(cls):
+        cls.policy = TimeLockPolicy(policy_id="timelock1")
+        cls.policy.base_lock_duration[Category.OPERATIONS] = 3600
+        cls.policy.base_lock_duration[Category.MARKETING] = 7200
+        cls.policy.amount_factor = 1000.0
+
+    def test_calculate_lock_duration(self):
+        cases = (
+            (500.0, Category.OPERATIONS, 3600),
+            (5000.0, Category.OPERATIONS, int(3600 + (5000 / 1000) * 3600)),
+            (500.0, Category.MARKETING, 7200),
+        )
+        for amount, category, expected in cases:
+            with self.subTest(amount=amount, category=category):
+                self.assertEqual(self.policy.calculate_lock_duration(amount, category), expected)
 
 
 class TestAmountThresholdPolicy(unittest.TestCase):
-    def setUp(self):
-        self.policy = AmountThresholdPolicy(policy_id="threshold1")
-        self.policy.add_threshold_range(0, 1000, 2)
-        self.policy.add_threshold_range(1000, 10000, 3)
-        self.policy.add_threshold_range(10000, float('inf'), 4)
-
-    def test_threshold_for_small_amount(self):
-        threshold = self.policy.get_required_threshold(500.0)
-        self.assertEqual(threshold, 2)
-
-    def test_threshold_for_medium_amount(self):
-        threshold = self.policy.get_required_threshold(5000.0)
-        self.assertEqual(threshold, 3)
-
-    def test_threshold_for_large_amount(self):
-        threshold = self.policy.get_required_threshold(50000.0)
-        self.assertEqual(threshold, 4)
+    @classmethod
+    def setUpClass(cls):
+        cls.policy = AmountThresholdPolicy(policy_id="threshold1")
+        cls.policy.add_threshold_range(0, 1000, 2)
+        cls.policy.add_threshold_range(1000, 10000, 3)
+        cls.policy.add_threshold_range(10000, float('inf'), 4)
+
+    def test_threshold_for_amount(self):
+        for amount, expected in ((500.0, 2), (5000.0, 3), (50000.0, 4)):
+            with self.subTest(amount=amount):
+                self.assertEqual(self.policy.get_required_threshold(amount), expected)
+
+    def test_threshold_range_boundaries(self):
+        cases = ((0, 2), (999.99, 2), (1000, 3), (9999.99, 3), (10000, 4), (-5, 4))
+        for amount, expected in cases:
+            with self.subTest(amount=amount):
+                self.assertEqual(self.policy.get_required_threshold(amount), expected)
+
+    def test_threshold_default_without_ranges(self):
+        self.assertEqual(AmountThresholdPolicy(policy_id="empty").get_required_threshold(100.0), 2)
+
+    def test_threshold_ranges_added_out_of_order(self):
+        policy = AmountThresholdPolicy(policy_id="threshold2")
+        policy.add_threshold_range(5000, 10000, 4)
+        policy.add_threshold_range(0, 1000, 2)
+        policy.add_threshold_range(1000, 5000, 3)
+        for amount, expected in ((0, 2), (999.99, 2), (1000, 3), (7500, 4), (20000, 4), (-1, 4)):
+            with self.subTest(amount=amount):
+                self.assertEqual(policy.get_required_threshold(amount), expected)
+
+    def test_overlapping_ranges_match_first(self):
+        policy = AmountThresholdPolicy(policy_id="threshold3")
+        policy.add_threshold_range(0, 1000, 2)
+        policy.add_threshold_range(500, 600, 5)
+        self.assertEqual(policy.get_required_threshold(550), 2)
+        self.assertEqual(policy.get_required_threshold(700), 2)
 
 
 class TestApprovalPolicy(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls._sigs_both = MappingProxyType({
+            "signer1": Signature("signer1", "sig1", _NOW, "hash1"),
+            "signer2": Signature("signer2", "sig2", _NOW, "hash1")
+        })
+        cls._sigs_one = MappingProxyType({
+            "signer1": Signature("signer1", "sig1", _NOW, "hash1")
+        })
+        cls._sigs_veto = MappingProxyType({
+            "veto_signer": Signature("veto_signer", "sig1", _NOW, "hash1")
+        })
+
     def setUp(self):
         self.policy = ApprovalPolicy(policy_id="approval1")
         self.policy.add_required_signer(Category.OPERATIONS, "signer1")
@@ -467,19 +778,8 @@ class TestApprovalPolicy(unittest.TestCase):
         self.policy.add_veto_signer("veto_signer")
 
     def test_required_signers_validation_success(self):
-        from .models import Signature
-        transaction = Transaction(
-            tx_id="tx1",
-            tx_type=TransactionType.TRANSFER,
-            recipient="recipient1",
-            amount=100.0,
-            coin_type="SUI"
-        )
-
-        signatures = {
-            "signer1": Signature("signer1", "sig1", datetime.now(), "hash1"),
-            "signer2": Signature("signer2", "sig2", datetime.now(), "hash1")
-        }
+        transaction = _tx(100.0)
+        signatures = self._sigs_both
 
         self.policy.validate(
             transaction,
@@ -487,18 +787,8 @@ class TestApprovalPolicy(unittest.TestCase):
         )
 
     def test_required_signers_validation_failure(self):
-        from .models import Signature
-        transaction = Transaction(
-            tx_id="tx1",
-            tx_type=TransactionType.TRANSFER,
-            recipient="recipient1",
-            amount=100.0,
-            coin_type="SUI"
-        )
-
-        signatures = {
-            "signer1": Signature("signer1", "sig1", datetime.now(), "hash1")
-        }
+        transaction = _tx(100.0)
+        signatures = self._sigs_one
 
         with self.assertRaises(PolicyViolation):
             self.policy.validate(
@@ -507,18 +797,8 @@ class TestApprovalPolicy(unittest.TestCase):
             )
 
     def test_veto_signer_validation(self):
-        from .models import Signature
-        transaction = Transaction(
-            tx_id="tx1",
-            tx_type=TransactionType.TRANSFER,
-            recipient="recipient1",
-            amount=100.0,
-            coin_type="SUI"
-        )
-
-        signatures = {
-            "veto_signer": Signature("veto_signer", "sig1", datetime.now(), "hash1")
-        }
+        transaction = _tx(100.0)
+        signatures = self._sigs_veto
 
         with self.assertRaises(PolicyViolation):
             self.policy.validate(
@@ -526,10 +806,39 @@ class TestApprovalPolicy(unittest.TestCase):
                 {"category": Category.OPERATIONS, "signatures": signatures}
             )
 
+    def test_signature_set_checked_by_key_view(self):
+        transaction = _tx(100.0)
+        signatures = SignatureSet()
+        signatures.add("signer1", "sig1", _NOW, "hash1")
+        context = {"category": Category.OPERATIONS, "signatures": signatures}
+
+        with self.assertRaisesRegex(PolicyViolation, "signer2"):
+            self.policy.validate(transaction, context)
+
+        signatures.add("signer2", "sig2", _NOW, "hash1")
+        self.policy.validate(transaction, context)
+
+        signatures.add("veto_signer", "sig3", _NOW, "hash1")
+        with self.assertRaisesRegex(PolicyViolation, "veto_signer"):
+            self.policy.validate(transaction, context)
+
+    def test_sealed_required_signers(self):
+        transaction = _tx(100.0)
+        self.policy.seal()
+        with self.assertRaises(PolicyViolation):
+            self.policy.validate(transaction, {"category": Category.OPERATIONS, "signatures": {"signer1": None}})
+        self.policy.validate(transaction, {"category": Category.MARKETING, "signatures": {}})
+        self.assertIsInstance(self.policy.veto_signers, frozenset)
+        self.assertIsInstance(self.policy.required_signers_by_category[Category.OPERATIONS], frozenset)
+        with self.assertRaises(RuntimeError):
+            self.policy.add_required_signer(Category.OPERATIONS, "signer3")
+        with self.assertRaises(RuntimeError):
+            self.policy.add_veto_signer("signer3")
+
 
 class TestEmergencyModule(unittest.TestCase):
     def setUp(self):
-        self.emergency_signers = {"esigner1", "esigner2", "esigner3"}
+        self.emergency_signers = _ESIGNERS
         self.emergency = EmergencyModule(
             emergency_threshold=2,
             emergency_signers=self.emergency_signers
@@ -540,35 +849,55 @@ class TestEmergencyModule(unittest.TestCase):
             initiator="esigner1",
             action_type="freeze",
             reason="Critical security issue",
-            current_time=datetime.now()
+            current_time=_NOW
         )
         self.assertIsNotNone(action_id)
         self.assertIn(action_id, self.emergency.actions)
 
+    def test_action_ids_are_unique(self):
+        action_ids = {
+            self.emergency.create_emergency_action(
+                initiator="esigner1",
+                action_type="freeze",
+                reason="Critical security issue",
+                current_time=_NOW
+            )
+            for _ in range(100)
+        }
+        self.assertEqual(len(action_ids), 100)
+
     def test_sign_emergency_action(self):
         action_id = self.emergency.create_emergency_action(
             initiator="esigner1",
             action_type="freeze",
             reason="Critical security issue",
-            current_time=datetime.now()
+            current_time=_NOW
         )
 
         self.emergency.sign_emergency_action(
             action_id=action_id,
             signer="esigner2",
             signature="sig1",
-            current_time=datetime.now()
+            current_time=_NOW
         )
 
         action = self.emergency.get_action(action_id)
         self.assertEqual(len(action.signatures), 1)
 
+    def test_sign_after_signers_reassigned_directly(self):
+        self.emergency.emergency_signers = self.emergency_signers | {"esigner4"}
+        action_id = self.emergency.create_emergency_action("esigner1", "freeze", "Rotation", _NOW)
+        self.emergency.sign_emergency_action(action_id, "esigner4", "sig4", _NOW)
+        self.emergency.sign_emergency_action(action_id, "esigner1", "sig1", _NOW)
+        self.assertEqual(self.emergency.get_action(action_id).signer_mask.bit_count(), 2)
+        self.assertTrue(self.emergency.can_execute_action(action_id))
+
     def test_can_execute_action(self):
         action_id = self.emergency.create_emergency_action(
             initiator="esigner1",
             action_type="freeze",
             reason="Critical security issue",
-            current_time=datetime.now()
+            current_time=_NOW
         )
 
         self.assertFalse(self.emergency.can_execute_action(action_id))
@@ -577,105 +906,93 @@ class TestEmergencyModule(unittest.TestCase):
             action_id=action_id,
             signer="esigner1",
             signature="sig1",
-            current_time=datetime.now()
+            current_time=_NOW
         )
 
         self.emergency.sign_emergency_action(
             action_id=action_id,
             signer="esigner2",
             signature="sig2",
-            current_time=datetime.now()
+            current_time=_NOW
         )
 
         self.assertTrue(self.emergency.can_execute_action(action_id))
 
 
 class TestEmergencyWorkflow(unittest.TestCase):
-    def setUp(self):
-        self.signers = {"signer1", "signer2", "signer3", "signer4", "signer5"}
-        self.treasury = Treasury(
+    @classmethod
+    def setUpClass(cls):
+        cls.signers = _SIGNERS_5
+        cls._template_treasury = Treasury(
             treasury_id="test_treasury",
-            signers=self.signers,
+            signers=cls.signers,
             threshold=3,
             emergency_threshold=2,
-            emergency_signers={"esigner1", "esigner2", "esigner3"}
+            emergency_signers=_ESIGNERS
         )
-        self.treasury.deposit("SUI", 10000.0, "signer1")
+        cls._template_treasury.deposit("SUI", 10000.0, "signer1")
 
-    def test_trigger_emergency_freeze(self):
-        current_time = datetime.now()
-        action_id = self.treasury.trigger_emergency_freeze(
-            initiator="esigner1",
-            reason="Critical issue",
-            current_time=current_time
-        )
-        self.assertIsNotNone(action_id)
+    def setUp(self):
+        self.treasury = copy.deepcopy(self._template_treasury)
 
-    def test_execute_emergency_freeze(self):
-        current_time = datetime.now()
+    def _freeze(self, current_time=None):
+        current_time = current_time or _NOW
         action_id = self.treasury.trigger_emergency_freeze(
             initiator="esigner1",
             reason="Critical issue",
             current_time=current_time
         )
-
-        self.treasury.sign_emergency_action(
-            action_id=action_id,
-            signer="esigner1",
-            signature="sig1",
-            current_time=current_time
-        )
-
-        self.treasury.sign_emergency_action(
-            action_id=action_id,
-            signer="esigner2",
-            signature="sig2",
-            current_time=current_time
-        )
-
+        for signer in ("esigner1", "esigner2"):
+            self.treasury.sign_emergency_action(
+                action_id=action_id,
+                signer=signer,
+                signature=f"sig_{signer}",
+                current_time=current_time
+            )
         self.treasury.execute_emergency_action(
             action_id=action_id,
             executor="esigner1",
             current_time=current_time
         )
+        return action_id
 
-        self.assertTrue(self.treasury.frozen)
-
-    def test_cannot_create_proposal_when_frozen(self):
-        current_time = datetime.now()
+    def test_trigger_emergency_freeze(self):
+        current_time = _NOW
         action_id = self.treasury.trigger_emergency_freeze(
             initiator="esigner1",
             reason="Critical issue",
             current_time=current_time
         )
+        self.assertIsNotNone(action_id)
 
-        self.treasury.sign_emergency_action(
-            action_id=action_id,
-            signer="esigner1",
-            signature="sig1",
-            current_time=current_time
-        )
-
-        self.treasury.sign_emergency_action(
-            action_id=action_id,
-            signer="esigner2",
-            signature="sig2",
-            current_time=current_time
-        )
+    @unittest.skipIf(QUICK, "full execution path; unset TREASURY_QUICK_TESTS to run")
+    def test_execute_emergency_freeze(self):
+        current_time = _NOW
+        self._freeze(current_time)
 
-        self.treasury.execute_emergency_action(
-            action_id=action_id,
-            executor="esigner1",
-            current_time=current_time
-        )
+        self.assertTrue(self.treasury.frozen)
+        with self.assertRaises(RuntimeError):
+            self.treasury.trigger_emergency_freeze(
+                initiator="esigner1",
+                reason="Repeat",
+                current_time=current_time + timedelta(hours=1)
+            )
+        self.assertTrue(self.treasury.config.can_trigger_emergency(current_time + timedelta(days=1)))
+
+    def test_cooldown_follows_direct_field_updates(self):
+        config = self.treasury.config
+        self.assertTrue(config.can_trigger_emergency(_NOW))
+        config.last_emergency_at = _NOW
+        self.assertFalse(config.can_trigger_emergency(_NOW + timedelta(hours=1)))
+        config.emergency_cooldown = 1800
+        self.assertTrue(config.can_trigger_emergency(_NOW + timedelta(hours=1)))
+        config.last_emergency_at = None
+        self.assertTrue(config.can_trigger_emergency(_NOW))
 
-        transaction = Transaction(
-            tx_id="tx1",
-            tx_type=TransactionType.TRANSFER,
-            recipient="recipient1",
-            amount=100.0,
-            coin_type="SUI"
-        )
+    def test_cannot_create_proposal_when_frozen(self):
+        current_time = _NOW
+        self._freeze(current_time)
+        transaction = _tx(100.0)
 
         with self.assertRaises(RuntimeError):
             self.treasury.create_proposal(
@@ -689,7 +1006,7 @@ class TestEmergencyWorkflow(unittest.TestCase):
 
 class TestSignerManagement(unittest.TestCase):
     def setUp(self):
-        self.signers = {"signer1", "signer2", "signer3"}
+        self.signers = set(_SIGNERS_3)
         self.treasury = Treasury(
             treasury_id="test_treasury",
             signers=self.signers,
@@ -709,6 +1026,58 @@ class TestSignerManagement(unittest.TestCase):
         self.treasury.remove_signer("signer4", "signer1")
         self.assertNotIn("signer4", self.treasury.config.signers)
 
+    def test_noop_signer_updates_are_not_audited(self):
+        before = len(self.treasury.get_audit_logs())
+        self.treasury.add_signer("signer1", "signer2")
+        self.treasury.remove_signer("stranger", "signer1")
+        self.treasury.add_emergency_signer("signer1", "signer2")
+        self.treasury.remove_emergency_signer("stranger", "signer1")
+        self.assertEqual(len(self.treasury.get_audit_logs()), before)
+        with self.assertRaises(PermissionError):
+            self.treasury.add_signer("signer1", "non_signer")
+
+    def test_signer_mask_tracks_membership(self):
+        config = self.treasury.config
+        self.assertEqual(config.signer_mask.bit_count(), 3)
+        self.treasury.add_signer("signer4", "signer1")
+        signer4_bit = config.signer_bit("signer4")
+        self.treasury.remove_signer("signer4", "signer1")
+        self.assertFalse(config.signer_mask & signer4_bit)
+        self.assertNotIn("signer4", config.signer_keys)
+
+        self.treasury.add_signer("signer5", "signer1")
+        self.assertNotEqual(config.signer_bit("signer5"), signer4_bit)
+        self.assertEqual(set(config.signer_keys), set(config.signers))
+
+        config.signers = config.signers | {"signer6"}
+        self.assertNotIn(config.signer_bit("signer6"), {config.signer_bit(s) for s in ("signer1", "signer5")})
+        state_signers = self.treasury.get_treasury_state()["signers"]
+        self.assertEqual(state_signers, ("signer1", "signer2", "signer3", "signer5"))
+        self.assertIs(self.treasury.get_treasury_state()["signers"], state_signers)
+
+    def test_signer_sets_are_snapshots(self):
+        self.treasury.add_signer("signer4", "signer1")
+        self.assertNotIn("signer4", self.signers)
+        self.assertIsInstance(self.treasury.config.signers, frozenset)
+
+    def test_remove_signer_updates_emergency_module(self):
+        self.treasury.add_signer("signer4", "signer1")
+        self.treasury.remove_signer("signer1", "signer2")
+        self.assertNotIn("signer1", self.treasury.config.emergency_signers)
+        self.assertNotIn("signer1", self.treasury.emergency_module.emergency_signers)
+
+    def test_emergency_signer_management(self):
+        self.treasury.add_emergency_signer("guardian", "signer1")
+        self.assertIn("guardian", self.treasury.config.emergency_signers)
+        self.assertNotIn("guardian", self.treasury.config.signers)
+        with self.assertRaises(PermissionError):
+            self.treasury.add_signer("signer4", "guardian")
+
+        self.treasury.remove_emergency_signer("guardian", "signer1")
+        self.assertNotIn("guardian", self.treasury.emergency_module.emergency_signers)
+        with self.assertRaises(PermissionError):
+            self.treasury.trigger_emergency_freeze("guardian", "test")
+
     def test_remove_signer_below_threshold(self):
         self.treasury.remove_signer("signer2", "signer1")
         self.assertNotIn("signer2", self.treasury.config.signers)
@@ -717,36 +1086,116 @@ class TestSignerManagement(unittest.TestCase):
 
 
 class TestAuditLog(unittest.TestCase):
-    def setUp(self):
-        self.signers = {"signer1", "signer2", "signer3"}
-        self.treasury = Treasury(
+    @classmethod
+    def setUpClass(cls):
+        cls.signers = _SIGNERS_3
+        cls._template_treasury = Treasury(
             treasury_id="test_treasury",
-            signers=self.signers,
+            signers=cls.signers,
             threshold=2
         )
 
+    def setUp(self):
+        self.treasury = copy.deepcopy(self._template_treasury)
+
     def test_audit_log_deposit(self):
         self.treasury.deposit("SUI", 1000.0, "signer1")
-        logs = self.treasury.get_audit_logs()
-        self.assertTrue(any(log.action == "deposit" for log in logs))
+        self.assertIn("deposit", self.treasury.get_audit_log_actions())
 
     def test_audit_log_create_proposal(self):
         self.treasury.deposit("SUI", 1000.0, "signer1")
-        transaction = Transaction(
-            tx_id="tx1",
-            tx_type=TransactionType.TRANSFER,
-            recipient="recipient1",
-            amount=100.0,
-            coin_type="SUI"
-        )
+        transaction = _tx(100.0)
         self.treasury.create_proposal(
             creator="signer1",
             transactions=[transaction],
             category=Category.OPERATIONS,
             description="Test"
         )
+        self.assertIn("create_proposal", self.treasury.get_audit_log_actions())
+        self.assertEqual(
+            {log.action for log in self.treasury.get_audit_logs()},
+            self.treasury.get_audit_log_actions()
+        )
+
+    def test_audit_log_buffer_flushes_in_order(self):
+        for i in range(AUDIT_LOG_BUFFER_SIZE + 3):
+            self.treasury.deposit("SUI", 1.0, "signer1")
+            self.assertEqual(len(self.treasury.audit_logs), i + 1)
+
         logs = self.treasury.get_audit_logs()
-        self.assertTrue(any(log.action == "create_proposal" for log in logs))
+        self.assertEqual(len(logs), AUDIT_LOG_BUFFER_SIZE + 3)
+        self.assertEqual(
+            [log.timestamp for log in logs],
+            sorted(log.timestamp for log in logs)
+        )
+        self.assertEqual(logs[0].details, {"coin_type": "SUI", "amount": 1.0})
+        self.assertLess(abs(logs[-1].timestamp - datetime.now()), timedelta(seconds=5))
+
+    def test_deposit_prefers_caller_time(self):
+        self.treasury.deposit("SUI", 1.0, "signer1", current_time=_NOW)
+        self.assertIs(self.treasury.balances["SUI"].last_updated, _NOW)
+        self.treasury.deposit("SUI", 1.0, "signer1")
+        self.assertLess(abs(self.treasury.balances["SUI"].last_updated - datetime.now()), timedelta(seconds=1))
+
+    def test_audit_detail_level_and_disable(self):
+        self.treasury.configure_audit(detail_level=AUDIT_DETAIL_BASIC)
+        self.treasury.deposit("SUI", 1.0, "signer1")
+        self.assertEqual(self.treasury.get_audit_logs()[-1].details, {"coin_type": "SUI", "amount": 1.0})
+
+        self.treasury.configure_audit(enabled=False)
+        self.treasury.deposit("SUI", 1.0, "signer1")
+        self.assertEqual(len(self.treasury.get_audit_logs()), 1)
+        self.assertEqual(self.treasury.get_balance("SUI"), 2.0)
+        with self.assertRaises(ValueError):
+            self.treasury.configure_audit(detail_level=0)
+
+    def test_audit_basic_keeps_identifying_details(self):
+        self.treasury.deposit("SUI", 100.0, "signer1")
+        self.treasury.configure_audit(detail_level=AUDIT_DETAIL_BASIC)
+        proposal_id = self.treasury.create_proposal(
+            creator="signer1",
+            transactions=[_tx(10.0)],
+            category=Category.OPERATIONS,
+            description="Audit details"
+        )
+        self.treasury.sign_proposal(proposal_id, "signer1", "sig1", _NOW)
+        create_log, sign_log = self.treasury.get_audit_logs()[-2:]
+        self.assertEqual(create_log.details, {"transactions": 1, "category": "operations"})
+        self.assertEqual(sign_log.details, {})
+
+    def test_audit_details_not_built_when_disabled(self):
+        self.treasury.deposit("SUI", 100.0, "signer1")
+        proposal_id = self.treasury.create_proposal(
+            creator="signer1",
+            transactions=[_tx(10.0)],
+            category=Category.OPERATIONS,
+            description="Audit details"
+        )
+        self.treasury.configure_audit(enabled=False)
+        with mock.patch.object(Proposal, "get_signature_count", side_effect=AssertionError):
+            self.treasury.sign_proposal(proposal_id, "signer2", "sig2", _NOW)
+
+    def test_audit_buffer_materialized_on_snapshot(self):
+        self.treasury.deposit("SUI", 1.0, "signer1")
+        restored = Treasury.restore(self.treasury.snapshot())
+        self.assertEqual(
+            [log.timestamp for log in restored.get_audit_logs()],
+            [log.timestamp for log in self.treasury.get_audit_logs()]
+        )
+        restored.deposit("SUI", 1.0, "signer1")
+        logs = restored.get_audit_logs()
+        self.assertLessEqual(logs[-2].timestamp, logs[-1].timestamp)
+
+    def test_audit_log_cancel_has_empty_details(self):
+        self.treasury.deposit("SUI", 1000.0, "signer1")
+        proposal_id = self.treasury.create_proposal(
+            creator="signer1",
+            transactions=[_tx(100.0)],
+            category=Category.OPERATIONS,
+            description="Test"
+        )
+        self.treasury.cancel_proposal(proposal_id, "signer1")
+        self.assertEqual(self.treasury.get_audit_logs()[-1].details, {})
 
 
 class TestPolicyManager(unittest.TestCase):
@@ -769,8 +1218,12 @@ class TestPolicyManager(unittest.TestCase):
             global_limit=5000.0
         )
         self.manager.add_policy(policy)
+        view = self.manager.list_policies()
+        snapshot = self.manager.list_policies_snapshot()
         self.manager.remove_policy("limit1")
         self.assertNotIn("limit1", self.manager.list_policies())
+        self.assertNotIn("limit1", view)
+        self.assertEqual(snapshot, ("limit1",))
 
     def test_get_policy(self):
         policy = SpendingLimitPolicy(
@@ -782,6 +1235,366 @@ class TestPolicyManager(unittest.TestCase):
         retrieved = self.manager.get_policy("limit1")
         self.assertEqual(retrieved.policy_id, "limit1")
 
+    def test_whitelist_policies_tracked(self):
+        first = WhitelistPolicy(policy_id="wl")
+        self.manager.add_policy(first)
+        self.manager.add_policy(SpendingLimitPolicy(
+            policy_id="limit1", period_type=PeriodType.DAILY, global_limit=5000.0
+        ))
+        self.assertEqual(self.manager.get_whitelist_policies(), [first])
+
+        replacement = WhitelistPolicy(policy_id="wl")
+        self.manager.add_policy(replacement)
+        self.assertEqual(self.manager.get_whitelist_policies(), [replacement])
+
+        self.manager.remove_policy("wl")
+        self.assertEqual(self.manager.get_whitelist_policies(), [])
+
+    def test_batch_validation_matches_per_transaction(self):
+        limit = SpendingLimitPolicy(
+            policy_id="limit1", period_type=PeriodType.DAILY, global_limit=5000.0,
+            max_per_transaction=2000.0
+        )
+        whitelist = WhitelistPolicy(policy_id="wl")
+        lock = TimeLockPolicy(policy_id="lock")
+        tiers = AmountThresholdPolicy(policy_id="tiers")
+        tiers.add_threshold_range(0, 1000, 2)
+        tiers.add_threshold_range(1000, float("inf"), 3)
+        for policy in (limit, whitelist, lock, tiers):
+            self.manager.add_policy(policy)
+        transactions = [
+            Transaction(
+                tx_id=f"tx{i}",
+                tx_type=TransactionType.TRANSFER,
+                recipient=f"recipient{i}",
+                amount=amount,
+                coin_type="SUI"
+            )
+            for i, amount in enumerate((500.0, 1500.0, 250.0))
+        ]
+        for tx in transactions:
+            whitelist.add_recipient(tx.recipient)
+
+        current_time = _NOW
+        batch_context = {"category": Category.OPERATIONS, "current_time": current_time}
+        single_context = dict(batch_context)
+        self.manager.validate_all_transactions(transactions, batch_context)
+        for tx in transactions:
+            self.manager.validate_transaction(tx, single_context)
+        self.assertEqual(batch_context, single_context)
+        self.assertEqual(batch_context["required_threshold"], 3)
+
+        whitelist.remove_recipient("recipient2")
+        with self.assertRaisesRegex(PolicyViolation, "recipient2"):
+            self.manager.validate_all_transactions(transactions, batch_context)
+        whitelist.add_recipient("recipient2")
+        limit.max_per_transaction = 1000.0
+        with self.assertRaisesRegex(PolicyViolation, "1500.0"):
+            self.manager.validate_all_transactions(transactions, batch_context)
+
+    def test_execution_skips_context_only_policies(self):
+        lock = TimeLockPolicy(policy_id="lock")
+        tiers = AmountThresholdPolicy(policy_id="tiers")
+        whitelist = WhitelistPolicy(policy_id="wl")
+        for policy in (lock, tiers, whitelist):
+            self.manager.add_policy(policy)
+        transactions = [_tx(100.0)]
+
+        context = {"category": Category.OPERATIONS, "current_time": _NOW}
+        with self.assertRaises(PolicyViolation):
+            self.manager.validate_for_execution(transactions, context)
+        self.assertNotIn("required_time_lock", context)
+        self.assertNotIn("required_threshold", context)
+
+        whitelist.add_recipient("recipient1")
+        self.manager.validate_for_execution(transactions, context)
+        self.manager.remove_policy("wl")
+        self.manager.validate_for_execution(transactions, context)
+        self.assertNotIn("required_time_lock", context)
+
+    def test_resolved_time_stays_out_of_caller_context(self):
+        whitelist = WhitelistPolicy(policy_id="wl")
+        whitelist.add_temporary_recipient("recipient1", datetime.now() + timedelta(hours=1))
+        self.manager.add_policy(whitelist)
+        self.manager.add_policy(SpendingLimitPolicy(
+            policy_id="limit1", period_type=PeriodType.DAILY, global_limit=5000.0
+        ))
+        transaction = _tx(100.0)
+        context = {"category": Category.OPERATIONS}
+        self.manager.validate_transaction(transaction, context)
+        self.assertEqual(context, {"category": Category.OPERATIONS})
+
+    def test_signer_keys_shared_across_approval_policies(self):
+        for policy_id in ("approval1", "approval2"):
+            policy = ApprovalPolicy(policy_id=policy_id)
+            policy.add_required_signer(Category.OPERATIONS, "signer1")
+            self.manager.add_policy(policy)
+        transaction = _tx(100.0)
+        signatures = SignatureSet()
+        context = {"category": Category.OPERATIONS, "signatures": signatures}
+        with self.assertRaises(PolicyViolation):
+            self.manager.validate_transaction(transaction, context)
+        self.assertEqual(set(context), {"category", "signatures"})
+
+        signatures.add("signer1", "sig1", _NOW, "hash1")
+        self.manager.validate_transaction(transaction, context)
+
+    def test_disabled_policy_skipped(self):
+        self.manager.add_policy(WhitelistPolicy(policy_id="wl"))
+        transaction = _tx(100.0)
+        context = {"current_time": _NOW}
+        with self.assertRaises(PolicyViolation):
+            self.manager.validate_transaction(transaction, context)
+
+        self.manager.get_policy("wl").enabled = False
+        self.manager.validate_transaction(transaction, context)
+
+        self.manager.get_policy("wl").enabled = True
+        with self.assertRaises(PolicyViolation):
+            self.manager.validate_transaction(transaction, context)
+
+    def test_custom_policy_without_slots_round_trips(self):
+        treasury = Treasury(treasury_id="t", signers=_SIGNERS_3, threshold=2)
+        treasury.policy_manager.add_policy(_MaxAmountPolicy("cap", 500.0))
+        for restored in (copy.deepcopy(treasury), Treasury.restore(treasury.snapshot())):
+            policy = restored.policy_manager.get_policy("cap")
+            self.assertEqual(policy.cap, 500.0)
+            restored.policy_manager.validate_transaction(_tx(100.0), {})
+            with self.assertRaises(PolicyViolation):
+                restored.policy_manager.validate_transaction(_tx(600.0), {})
+
+    def test_enabled_attribute_toggled_directly(self):
+        whitelist = WhitelistPolicy(policy_id="wl", enabled=False)
+        self.manager.add_policy(whitelist)
+        transaction = _tx(100.0)
+        context = {"current_time": _NOW}
+        self.manager.validate_transaction(transaction, context)
+        self.manager.validate_all_transactions([transaction], context)
+        whitelist.validate(transaction, context)
+
+        whitelist.enabled = True
+        with self.assertRaises(PolicyViolation):
+            self.manager.validate_transaction(transaction, context)
+        with self.assertRaises(PolicyViolation):
+            self.manager.validate_all_transactions([transaction], context)
+        with self.assertRaises(PolicyViolation):
+            self.manager.validate_for_execution([transaction], context)
+
+        whitelist.enabled = False
+        self.manager.validate_transaction(transaction, context)
+        self.manager.validate_for_execution([transaction], context)
+
+    def test_policies_indexed_by_type(self):
+        lock = TimeLockPolicy(policy_id="lock")
+        lock.base_lock_duration[Category.OPERATIONS] = 7200
+        self.manager.add_policy(lock)
+        self.manager.add_policy(WhitelistPolicy(policy_id="wl"))
+        self.assertEqual(self.manager.get_policies_by_type("timelock"), [lock])
+
+        transaction = _tx(100.0)
+        self.assertEqual(
+            self.manager.get_required_time_lock([transaction], Category.OPERATIONS), 7200
+        )
+
+        self.manager.remove_policy("lock")
+        self.assertEqual(self.manager.get_policies_by_type("timelock"), [])
+        self.assertEqual(
+            self.manager.get_required_time_lock([transaction], Category.OPERATIONS), 0
+        )
+
+    def test_required_limits_match_separate_helpers(self):
+        lock = TimeLockPolicy(policy_id="lock", amount_factor=500.0)
+        tiers = AmountThresholdPolicy(policy_id="tiers")
+        tiers.add_threshold_range(0, 1000, 2)
+        tiers.add_threshold_range(1000, float("inf"), 4)
+        self.manager.add_policy(lock)
+        self.manager.add_policy(tiers)
+        transactions = [_tx(250.0), _tx(1500.0, tx_id="tx2")]
+
+        self.assertEqual(
+            self.manager.required_limits(transactions, Category.RESEARCH),
+            (
+                self.manager.get_required_threshold(transactions),
+                self.manager.get_required_time_lock(transactions, Category.RESEARCH)
+            )
+        )
+        self.assertEqual(self.manager.required_limits(transactions, Category.RESEARCH), (4, 3600 + 3 * 3600))
+        tiers.enabled = False
+        self.assertEqual(self.manager.required_limits(transactions, Category.RESEARCH)[0], 0)
+
+
+class TestTransactionHashing(unittest.TestCase):
+    def setUp(self):
+        self.transactions = [
+            Transaction(
+                tx_id=f"tx{i}",
+                tx_type=TransactionType.TRANSFER,
+                recipient=f"recipient{i}",
+                amount=100.0 * (i + 1),
+                coin_type="SUI"
+            )
+            for i in range(3)
+        ]
+
+    def test_batch_hashes_match_single_hashes(self):
+        batch = batch_compute_hashes(self.transactions)
+        expected = [
+            Transaction(
+                tx_id=tx.tx_id,
+                tx_type=tx.tx_type,
+                recipient=tx.recipient,
+                amount=tx.amount,
+                coin_type=tx.coin_type
+            ).compute_hash_bytes()
+            for tx in self.transactions
+        ]
+        self.assertEqual(batch, expected)
+        self.assertEqual(self.transactions[0].compute_hash(), batch[0].hex())
+
+    def test_compute_hash_is_cached(self):
+        transaction = self.transactions[0]
+        self.assertIs(transaction.compute_hash(), transaction.compute_hash())
+
+    def test_transaction_fields_are_immutable(self):
+        with self.assertRaises(AttributeError):
+            self.transactions[0].amount = 1.0
+
+    def test_metadata_is_part_of_hash(self):
+        base = dict(tx_id="tx1", tx_type=TransactionType.TRANSFER, recipient="recipient1", amount=1.0)
+        plain = Transaction(**base)
+        tagged = Transaction(**base, metadata={"memo": "invoice-7"})
+        self.assertNotEqual(plain.compute_hash(), tagged.compute_hash())
+
+    def test_metadata_digests_are_pinned(self):
+        cases = (
+            ({"fee": 1e16, "rate": 1e-7}, "deb8e7305e1b13353801735daee7bddb79c350a5449ab1811ec948c3c91fddbd"),
+            ({"x": float("nan")}, "244404863330ebe89fcbc392aac1d531c2ac24b6f19c64284117a0edc4079133"),
+            ({"z": {"b": [1, 2.5], "a": "d"}, "k": None},
+             "2a4a9778ac83e01d2ddd12788f84b0cbf3cbca357173ccf79d58d828cf62b25f"),
+        )
+        for metadata, digest in cases:
+            with self.subTest(metadata=metadata):
+                transaction = Transaction(
+                    tx_id="tx1",
+                    tx_type=TransactionType.TRANSFER,
+                    recipient="recipient1",
+                    amount=100.0,
+                    metadata=metadata
+                )
+                self.assertEqual(transaction.compute_hash(), digest)
+
+    def test_distinct_transactions_hash_differently(self):
+        hashes = batch_compute_hashes(self.transactions)
+        self.assertEqual(len(set(hashes)), len(hashes))
+
+
+class TestProposalModel(unittest.TestCase):
+    def setUp(self):
+        self.created_at = datetime(2024, 1, 1, 12, 0, 0)
+        self.proposal = Proposal(
+            proposal_id="p1",
+            creator="signer1",
+            transactions=[],
+            category=Category.OPERATIONS,
+            description="Test",
+            threshold_required=1,
+            created_at=self.created_at,
+            time_lock_duration=3600,
+            status=ProposalStatus.TIME_LOCKED,
+            signatures={"signer1": Signature("signer1", "sig1", self.created_at, "hash1")}
+        )
+
+    def test_can_execute_after_time_lock(self):
+        self.assertFalse(self.proposal.can_execute(self.created_at))
+        self.assertTrue(self.proposal.can_execute(self.created_at + timedelta(hours=1)))
+
+    def test_can_execute_with_epoch_timestamp(self):
+        unlock_ts = (self.created_at + timedelta(hours=1)).timestamp()
+        self.assertFalse(self.proposal.can_execute(self.created_at, current_ts=unlock_ts - 1))
+        self.assertTrue(self.proposal.can_execute(self.created_at, current_ts=unlock_ts))
+
+    def test_threshold_reached_recorded_on_sign(self):
+        proposal = Proposal(
+            proposal_id="p2",
+            creator="signer1",
+            transactions=[],
+            category=Category.OPERATIONS,
+            description="Test",
+            threshold_required=2,
+            created_at=self.created_at,
+            time_lock_duration=0,
+            status=ProposalStatus.TIME_LOCKED
+        )
+        proposal.add_signature("signer1", "sig1", self.created_at, "hash1", 1)
+        self.assertFalse(proposal.can_execute(self.created_at))
+
+        second = self.created_at + timedelta(minutes=5)
+        proposal.add_signature("signer2", "sig2", second, "hash1", 2)
+        proposal.add_signature("signer3", "sig3", second + timedelta(minutes=5), "hash1", 4)
+        self.assertTrue(proposal.can_execute(second))
+        self.assertTrue(self.proposal.can_execute(self.created_at + timedelta(hours=1)))
+
+    def test_cannot_execute_in_terminal_status(self):
+        for status in (ProposalStatus.EXECUTED, ProposalStatus.CANCELLED, ProposalStatus.FAILED):
+            self.proposal.status = status
+            self.assertFalse(self.proposal.can_execute(self.created_at + timedelta(hours=1)))
+
+
+class TestSignatureVerification(unittest.TestCase):
+    def setUp(self):
+        now = _NOW
+        self.signatures = [
+            Signature("signer1", "sig1", now, "hash1"),
+            Signature("signer2", "sig2", now, "hash1"),
+            Signature("signer3", "sig3", now, "other_hash")
+        ]
+
+    def test_count_verified_stops_at_required(self):
+        signature_set = SignatureSet({sig.signer: sig for sig in self.signatures})
+        self.assertEqual(signature_set.count_verified("hash1", 1), 1)
+
+    def test_signature_set_matches_dict_view(self):
+        signature_set = SignatureSet({sig.signer: sig for sig in self.signatures})
+        self.assertEqual(len(signature_set), 3)
+        self.assertIn("signer2", signature_set)
+        self.assertEqual(signature_set["signer2"], self.signatures[1])
+        self.assertEqual(list(signature_set.keys()), ["signer1", "signer2", "signer3"])
+        self.assertEqual(signature_set.count_verified("hash1", 3), 2)
+
+    def test_signature_set_membership_small_and_large(self):
+        signature_set = SignatureSet()
+        for i in range(12):
+            signature_set.add(f"signer{i}", f"sig{i}", _NOW, "hash1")
+            with self.subTest(size=i + 1):
+                self.assertIn(f"signer{i}", signature_set)
+                self.assertIn("signer0", signature_set)
+                self.assertNotIn("stranger", signature_set)
+
+    def test_signature_set_rejects_duplicate_signer(self):
+        signature_set = SignatureSet()
+        signature_set.add("signer1", "sig1", _NOW, "hash1")
+        with self.assertRaises(ValueError):
+            signature_set.add("signer1", "sig2", _NOW, "hash1")
+
+
+class TestModelLayout(unittest.TestCase):
+    def test_hot_models_have_no_instance_dict(self):
+        instances = (
+            _tx(100.0),
+            Signature("signer1", "sig1", _NOW, "hash1"),
+            SpendingRecord(
+                amount=100.0,
+                timestamp=_NOW,
+                category=Category.OPERATIONS,
+                proposal_id="p1",
+                tx_hash="hash1"
+            ),
+            TreasuryAuditLog(_NOW, "deposit", "signer1"),
+        )
+        for instance in instances:
+            with self.subTest(model=type(instance).__name__):
+                self.assertFalse(hasattr(instance, "__dict__"))
+
 
 if __name__ == "__main__":
     unittest.main()
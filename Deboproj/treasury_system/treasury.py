@@ -1,17 +1,54 @@
+import hashlib
+import pickle
+import sys
+import time
+from array import array
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set
-import uuid
+from types import MappingProxyType
+from typing import Callable, Dict, FrozenSet, Iterable, List, Mapping, Optional, Set, Tuple
 from .models import (
     TreasuryBalance, TreasuryConfig, Proposal, Transaction,
-    ProposalStatus, Category, Signature, SpendingRecord,
-    EmergencyAction, PeriodType
+    ProposalStatus, Category, SpendingRecord,
+    EmergencyAction, PeriodType, ExecutionCheck, batch_compute_hashes, generate_id,
+    _CATEGORY_VALUES, _STATUS_VALUES, _pack_str
 )
 from .policies import PolicyManager, PolicyViolation
 from .emergency import EmergencyModule
 
 
-@dataclass
+_SIGNABLE_STATUSES = frozenset({ProposalStatus.PENDING, ProposalStatus.TIME_LOCKED})
+
+_CHECK_MESSAGES = {
+    ExecutionCheck.MISSING_COIN: "No balance for coin type {}",
+    ExecutionCheck.INSUFFICIENT_BALANCE: "Insufficient balance for {}",
+    ExecutionCheck.INVALID_AMOUNT: "Transaction amounts must be positive ({})",
+}
+
+PERM_SIGN = 1
+PERM_EMERGENCY = 2
+
+AUDIT_DETAIL_BASIC = 1
+AUDIT_DETAIL_VERBOSE = 2
+# Derived figures that are only recorded at AUDIT_DETAIL_VERBOSE; the
+# identifying details (signers, amounts, reasons, errors) are always kept.
+_VERBOSE_DETAIL_KEYS = frozenset({"total_amount", "signature_count", "time_lock_duration", "threshold"})
+
+AUDIT_LOG_BUFFER_SIZE = 256
+AUDIT_LOG_FLUSH_INTERVAL = timedelta(seconds=1)
+_AUDIT_LOG_FLUSH_INTERVAL_NS = AUDIT_LOG_FLUSH_INTERVAL // timedelta(microseconds=1) * 1000
+
+
+def _enum_member(enum_cls, value):
+    # Filters also accept the plain string values; unknown values match nothing.
+    try:
+        return enum_cls(value)
+    except ValueError:
+        return None
+
+
+@dataclass(slots=True)
 class TreasuryAuditLog:
     timestamp: datetime
     action: str
@@ -24,11 +61,12 @@ class Treasury:
     def __init__(
         self,
         treasury_id: str,
-        signers: Set[str],
+        signers: Iterable[str],
         threshold: int,
         emergency_threshold: int = None,
-        emergency_signers: Set[str] = None
+        emergency_signers: Iterable[str] = None
     ):
+        signers = frozenset(signers)
         if threshold > len(signers):
             raise ValueError("Threshold cannot exceed number of signers")
 
@@ -41,56 +79,138 @@ class Treasury:
             emergency_signers=emergency_signers or signers
         )
 
-        self.balances: Dict[str, TreasuryBalance] = {}
+        self._coin_index: Dict[str, int] = {}
+        self._amounts = array("d")
+        self._last_updated: List[datetime] = []
+        self._balance_views: Dict[str, TreasuryBalance] = {}
         self.proposals: Dict[str, Proposal] = {}
+        self._by_status: Dict[ProposalStatus, Dict[str, None]] = {status: {} for status in ProposalStatus}
         self.policy_manager = PolicyManager()
         self.emergency_module = EmergencyModule(
             emergency_threshold=self.config.emergency_threshold,
             emergency_signers=self.config.emergency_signers
         )
+        self.permissions: Dict[str, int] = {}
+        for signer in self.config.signers:
+            self.permissions[signer] = PERM_SIGN
+        for signer in self.config.emergency_signers:
+            self.permissions[signer] = self.permissions.get(signer, 0) | PERM_EMERGENCY
         self.spending_records: List[SpendingRecord] = []
-        self.audit_logs: List[TreasuryAuditLog] = []
+        self._records_by_category: Dict[Category, List[SpendingRecord]] = {category: [] for category in Category}
+        self._total_spending = 0.0
+        self._spending_by_category: Dict[Category, float] = {}
+        self._audit_logs: List[TreasuryAuditLog] = []
+        self._audit_buffer: deque = deque(maxlen=AUDIT_LOG_BUFFER_SIZE)
+        self._audit_enabled = True
+        self._audit_detail_level = AUDIT_DETAIL_VERBOSE
+        self._anchor_audit_clock()
+        self._audit_last_flush = self._audit_epoch_mono
+        self._action_index: Set[str] = set()
         self.frozen = False
 
+    def _grant(self, signer: str, permission: int) -> None:
+        self.permissions[signer] = self.permissions.get(signer, 0) | permission
+
+    def _revoke(self, signer: str, permission: int) -> None:
+        remaining = self.permissions.get(signer, 0) & ~permission
+        if remaining:
+            self.permissions[signer] = remaining
+        else:
+            self.permissions.pop(signer, None)
+
     def add_signer(self, new_signer: str, authorizer: str) -> None:
-        if authorizer not in self.config.signers:
+        if not self.permissions.get(authorizer, 0) & PERM_SIGN:
             raise PermissionError(f"{authorizer} is not an authorized signer")
 
-        self.config.signers.add(new_signer)
-        self._audit_log("add_signer", authorizer, details={"new_signer": new_signer})
+        if self.config.is_valid_signer(new_signer):
+            return
+
+        self.config.add_signer(new_signer)
+        self._grant(new_signer, PERM_SIGN)
+        self._audit_log("add_signer", authorizer, details=lambda: {"new_signer": new_signer})
 
     def remove_signer(self, signer_to_remove: str, authorizer: str) -> None:
-        if authorizer not in self.config.signers:
+        if not self.permissions.get(authorizer, 0) & PERM_SIGN:
             raise PermissionError(f"{authorizer} is not an authorized signer")
 
+        if not self.config.is_valid_signer(signer_to_remove):
+            return
+
         if len(self.config.signers) <= self.config.threshold:
             raise ValueError("Cannot remove signer when it would drop below threshold")
 
-        self.config.signers.discard(signer_to_remove)
-        self.config.emergency_signers.discard(signer_to_remove)
-        self._audit_log("remove_signer", authorizer, details={"removed_signer": signer_to_remove})
+        self.config.remove_signer(signer_to_remove)
+        self.emergency_module.emergency_signers = self.config.emergency_signers
+        self._revoke(signer_to_remove, PERM_SIGN | PERM_EMERGENCY)
+        self._audit_log("remove_signer", authorizer, details=lambda: {"removed_signer": signer_to_remove})
 
-    def deposit(self, coin_type: str, amount: float, depositor: str) -> None:
+    def add_emergency_signer(self, new_signer: str, authorizer: str) -> None:
+        if not self.permissions.get(authorizer, 0) & PERM_EMERGENCY:
+            raise PermissionError(f"{authorizer} is not an emergency signer")
+
+        if new_signer in self.config.emergency_signers:
+            return
+
+        self.emergency_module.add_emergency_signer(new_signer)
+        self.config.emergency_signers = self.emergency_module.emergency_signers
+        self._grant(new_signer, PERM_EMERGENCY)
+        self._audit_log("add_emergency_signer", authorizer, details=lambda: {"new_signer": new_signer})
+
+    def remove_emergency_signer(self, signer_to_remove: str, authorizer: str) -> None:
+        if not self.permissions.get(authorizer, 0) & PERM_EMERGENCY:
+            raise PermissionError(f"{authorizer} is not an emergency signer")
+
+        if signer_to_remove not in self.config.emergency_signers:
+            return
+
+        self.emergency_module.remove_emergency_signer(signer_to_remove)
+        self.config.emergency_signers = self.emergency_module.emergency_signers
+        self._revoke(signer_to_remove, PERM_EMERGENCY)
+        self._audit_log("remove_emergency_signer", authorizer, details=lambda: {"removed_signer": signer_to_remove})
+
+    def deposit(self, coin_type: str, amount: float, depositor: str, current_time: Optional[datetime] = None) -> None:
         if amount <= 0:
             raise ValueError("Deposit amount must be positive")
 
-        if coin_type not in self.balances:
-            self.balances[coin_type] = TreasuryBalance(
-                coin_type=coin_type,
-                amount=0.0,
-                last_updated=datetime.now()
-            )
+        current_time = self._now(current_time)
+
+        index = self._coin_index.get(coin_type)
+        if index is None:
+            index = self._coin_index[coin_type] = len(self._amounts)
+            self._amounts.append(0.0)
+            self._last_updated.append(current_time)
+            self._balance_views[coin_type] = TreasuryBalance(coin_type, self._amounts, self._last_updated, index)
+
+        self._amounts[index] += amount
+        self._last_updated[index] = current_time
+        self._audit_log("deposit", depositor, details=lambda: {"coin_type": coin_type, "amount": amount})
 
-        self.balances[coin_type].deposit(amount)
-        self._audit_log("deposit", depositor, details={"coin_type": coin_type, "amount": amount})
+    @property
+    def balances(self) -> Mapping[str, TreasuryBalance]:
+        return MappingProxyType(self._balance_views)
 
     def get_balance(self, coin_type: str) -> float:
-        if coin_type not in self.balances:
-            return 0.0
-        return self.balances[coin_type].amount
+        index = self._coin_index.get(coin_type)
+        return self._amounts[index] if index is not None else 0.0
+
+    def _check_funding(
+        self, transactions: List[Transaction]
+    ) -> Tuple[ExecutionCheck, Optional[str], Dict[str, float]]:
+        totals_by_coin: Dict[str, float] = {}
+        for transaction in transactions:
+            if transaction.amount <= 0:
+                return ExecutionCheck.INVALID_AMOUNT, transaction.coin_type, totals_by_coin
+            totals_by_coin[transaction.coin_type] = totals_by_coin.get(transaction.coin_type, 0.0) + transaction.amount
+        for coin_type, total in totals_by_coin.items():
+            index = self._coin_index.get(coin_type)
+            if index is None:
+                return ExecutionCheck.MISSING_COIN, coin_type, totals_by_coin
+            if total > self._amounts[index]:
+                return ExecutionCheck.INSUFFICIENT_BALANCE, coin_type, totals_by_coin
+        return ExecutionCheck.OK, None, totals_by_coin
 
     def get_all_balances(self) -> Dict[str, float]:
-        return {coin_type: balance.amount for coin_type, balance in self.balances.items()}
+        return dict(zip(self._coin_index, self._amounts))
 
     def create_proposal(
         self,
@@ -100,7 +220,7 @@ class Treasury:
         description: str,
         current_time: Optional[datetime] = None
     ) -> str:
-        if creator not in self.config.signers:
+        if not self.permissions.get(creator, 0) & PERM_SIGN:
             raise PermissionError(f"{creator} is not an authorized signer")
 
         if self.frozen:
@@ -112,25 +232,25 @@ class Treasury:
         if len(transactions) > 50:
             raise ValueError("Maximum 50 transactions per proposal")
 
-        current_time = current_time or datetime.now()
+        check, coin_type, _ = self._check_funding(transactions)
+        if check is not ExecutionCheck.OK:
+            raise ValueError(_CHECK_MESSAGES[check].format(coin_type))
 
-        for transaction in transactions:
-            try:
-                context = {
-                    "category": category,
-                    "current_time": current_time,
-                    "signatures": {}
-                }
-                self.policy_manager.validate_transaction(transaction, context)
-            except PolicyViolation as e:
-                raise PolicyViolation(e.policy_name, f"Proposal validation failed: {e.message}")
-
-        proposal_id = str(uuid.uuid4())
-        time_lock_duration = self.policy_manager.get_required_time_lock(transactions, category)
-        required_threshold = max(
-            self.config.threshold,
-            self.policy_manager.get_required_threshold(transactions)
-        )
+        current_time = self._now(current_time)
+
+        context = {
+            "category": category,
+            "current_time": current_time,
+            "signatures": {}
+        }
+        try:
+            self.policy_manager.validate_all_transactions(transactions, context)
+        except PolicyViolation as e:
+            raise PolicyViolation(e.policy_name, f"Proposal validation failed: {e.message}")
+
+        proposal_id = generate_id()
+        policy_threshold, time_lock_duration = self.policy_manager.required_limits(transactions, category)
+        required_threshold = max(self.config.threshold, policy_threshold)
 
         proposal = Proposal(
             proposal_id=proposal_id,
@@ -145,9 +265,10 @@ class Treasury:
         )
 
         self.proposals[proposal_id] = proposal
-        self._audit_log("create_proposal", creator, proposal_id, {
+        self._by_status[proposal.status][proposal_id] = None
+        self._audit_log("create_proposal", creator, proposal_id, lambda: {
             "transactions": len(transactions),
-            "category": category.value,
+            "category": _CATEGORY_VALUES[category],
             "time_lock_duration": time_lock_duration,
             "threshold": required_threshold
         })
@@ -155,90 +276,96 @@ class Treasury:
         return proposal_id
 
     def sign_proposal(self, proposal_id: str, signer: str, signature: str, current_time: Optional[datetime] = None) -> None:
-        if proposal_id not in self.proposals:
+        proposal = self.proposals.get(proposal_id)
+        if proposal is None:
             raise ValueError(f"Proposal {proposal_id} not found")
 
-        if signer not in self.config.signers:
+        if not self.permissions.get(signer, 0) & PERM_SIGN:
             raise PermissionError(f"{signer} is not an authorized signer")
 
-        proposal = self.proposals[proposal_id]
-
-        if proposal.status not in [ProposalStatus.PENDING, ProposalStatus.TIME_LOCKED]:
-            raise ValueError(f"Cannot sign proposal in status {proposal.status.value}")
+        if proposal.status not in _SIGNABLE_STATUSES:
+            raise ValueError(f"Cannot sign proposal in status {_STATUS_VALUES[proposal.status]}")
 
-        if signer in proposal.signatures:
+        signer_bit = self.config.signer_bit(signer)
+        if proposal.signer_mask & signer_bit:
             raise ValueError(f"{signer} has already signed this proposal")
 
-        current_time = current_time or datetime.now()
+        current_time = self._now(current_time)
         tx_hash = self._compute_proposal_hash(proposal)
 
-        proposal.signatures[signer] = Signature(
-            signer=signer,
-            signature=signature,
-            timestamp=current_time,
-            tx_hash=tx_hash
-        )
+        proposal.add_signature(signer, signature, current_time, tx_hash, signer_bit)
 
-        self._audit_log("sign_proposal", signer, proposal_id, {
-            "signature_count": len(proposal.signatures)
+        self._audit_log("sign_proposal", signer, proposal_id, lambda: {
+            "signature_count": proposal.get_signature_count()
         })
 
     def execute_proposal(self, proposal_id: str, executor: str, current_time: Optional[datetime] = None) -> None:
-        if proposal_id not in self.proposals:
+        proposal = self.proposals.get(proposal_id)
+        if proposal is None:
             raise ValueError(f"Proposal {proposal_id} not found")
 
-        current_time = current_time or datetime.now()
-        proposal = self.proposals[proposal_id]
+        current_time = self._now(current_time)
 
         if not proposal.can_execute(current_time):
-            time_locked_until = proposal.created_at + timedelta(seconds=proposal.time_lock_duration)
             raise ValueError(
-                f"Proposal cannot execute. Time lock until {time_locked_until}, "
+                f"Proposal cannot execute. Time lock until {proposal.unlock_at}, "
                 f"threshold {proposal.get_signature_count()}/{proposal.threshold_required}"
             )
 
-        try:
-            for transaction in proposal.transactions:
-                context = {
-                    "category": proposal.category,
-                    "current_time": current_time,
-                    "signatures": proposal.signatures
-                }
-                self.policy_manager.validate_transaction(transaction, context)
-
-                if transaction.coin_type not in self.balances:
-                    raise ValueError(f"No balance for coin type {transaction.coin_type}")
-
-                if not self.balances[transaction.coin_type].withdraw(transaction.amount):
-                    raise ValueError(f"Insufficient balance for {transaction.coin_type}")
-
-                spending_record = SpendingRecord(
-                    amount=transaction.amount,
-                    timestamp=current_time,
-                    category=proposal.category,
-                    proposal_id=proposal_id,
-                    tx_hash=transaction.compute_hash()
-                )
-                self.spending_records.append(spending_record)
-
-            proposal.status = ProposalStatus.EXECUTED
-            proposal.executed_at = current_time
-            self._audit_log("execute_proposal", executor, proposal_id, {
-                "transactions": len(proposal.transactions),
-                "total_amount": sum(t.amount for t in proposal.transactions)
-            })
+        if not proposal.verify_signatures(self._compute_proposal_hash(proposal)):
+            raise ValueError("Proposal signatures failed verification")
 
+        context = {
+            "category": proposal.category,
+            "current_time": current_time,
+            "signatures": proposal.signatures
+        }
+        try:
+            self.policy_manager.validate_for_execution(proposal.transactions, context)
+            check, coin_type, totals_by_coin = self._check_funding(proposal.transactions)
+            if check is not ExecutionCheck.OK:
+                raise ValueError(_CHECK_MESSAGES[check].format(coin_type))
         except Exception as e:
-            proposal.status = ProposalStatus.FAILED
-            self._audit_log("execute_proposal_failed", executor, proposal_id, {"error": str(e)})
+            self._set_status(proposal, ProposalStatus.FAILED)
+            self._audit_log("execute_proposal_failed", executor, proposal_id, lambda: {"error": str(e)})
             raise
 
+        # Every check has passed; the commit phase only updates in-memory state.
+        coin_index, amounts, last_updated = self._coin_index, self._amounts, self._last_updated
+        for coin_type, total in totals_by_coin.items():
+            index = coin_index[coin_type]
+            amounts[index] -= total
+            last_updated[index] = current_time
+
+        category = proposal.category
+        category_records = self._records_by_category[category]
+        total_amount = 0.0
+        for transaction in proposal.transactions:
+            spending_record = SpendingRecord(
+                amount=transaction.amount,
+                timestamp=current_time,
+                category=category,
+                proposal_id=proposal_id,
+                tx_hash=transaction.compute_hash()
+            )
+            self.spending_records.append(spending_record)
+            category_records.append(spending_record)
+            total_amount += transaction.amount
+        self._total_spending += total_amount
+        self._spending_by_category[category] = self._spending_by_category.get(category, 0.0) + total_amount
+
+        self._set_status(proposal, ProposalStatus.EXECUTED)
+        proposal.executed_at = current_time
+        self._audit_log("execute_proposal", executor, proposal_id, lambda: {
+            "transactions": len(proposal.transactions),
+            "total_amount": total_amount
+        })
+
     def cancel_proposal(self, proposal_id: str, canceller: str, current_time: Optional[datetime] = None) -> None:
-        if proposal_id not in self.proposals:
+        proposal = self.proposals.get(proposal_id)
+        if proposal is None:
             raise ValueError(f"Proposal {proposal_id} not found")
 
-        proposal = self.proposals[proposal_id]
-
         if proposal.creator != canceller and canceller not in proposal.signatures:
             raise PermissionError(f"{canceller} cannot cancel this proposal")
 
@@ -248,108 +375,190 @@ class Treasury:
         if proposal.status == ProposalStatus.CANCELLED:
             raise ValueError("Proposal already cancelled")
 
-        current_time = current_time or datetime.now()
-        proposal.status = ProposalStatus.CANCELLED
+        current_time = self._now(current_time)
+        self._set_status(proposal, ProposalStatus.CANCELLED)
         proposal.cancelled_at = current_time
         self._audit_log("cancel_proposal", canceller, proposal_id)
 
+    def _set_status(self, proposal: Proposal, status: ProposalStatus) -> None:
+        self._by_status[proposal.status].pop(proposal.proposal_id, None)
+        self._by_status[status][proposal.proposal_id] = None
+        proposal.status = status
+
     def get_proposal(self, proposal_id: str) -> Optional[Proposal]:
         return self.proposals.get(proposal_id)
 
     def list_proposals(self, status: Optional[ProposalStatus] = None) -> List[str]:
         if status is None:
             return list(self.proposals.keys())
-        return [pid for pid, p in self.proposals.items() if p.status == status]
+        return list(self._by_status.get(_enum_member(ProposalStatus, status), ()))
 
     def get_spending_history(self, category: Optional[Category] = None) -> List[SpendingRecord]:
         if category is None:
             return self.spending_records
-        return [r for r in self.spending_records if r.category == category]
+        return list(self._records_by_category.get(_enum_member(Category, category), ()))
+
+    def get_total_spending(self, category: Optional[Category] = None) -> float:
+        if category is None:
+            return self._total_spending
+        return self._spending_by_category.get(category, 0.0)
 
     def trigger_emergency_freeze(self, initiator: str, reason: str, current_time: Optional[datetime] = None) -> str:
-        if initiator not in self.config.emergency_signers:
+        if not self.permissions.get(initiator, 0) & PERM_EMERGENCY:
             raise PermissionError(f"{initiator} is not an emergency signer")
 
-        current_time = current_time or datetime.now()
+        current_time = self._now(current_time)
 
         if not self.config.can_trigger_emergency(current_time):
             raise RuntimeError("Emergency cooldown period still active")
 
         action_id = self.emergency_module.create_emergency_action(initiator, "freeze", reason, current_time)
-        self._audit_log("emergency_freeze_initiated", initiator, details={"action_id": action_id, "reason": reason})
+        self._audit_log("emergency_freeze_initiated", initiator, details=lambda: {"action_id": action_id, "reason": reason})
         return action_id
 
     def sign_emergency_action(self, action_id: str, signer: str, signature: str, current_time: Optional[datetime] = None) -> None:
-        if signer not in self.config.emergency_signers:
+        if not self.permissions.get(signer, 0) & PERM_EMERGENCY:
             raise PermissionError(f"{signer} is not an emergency signer")
 
-        current_time = current_time or datetime.now()
+        current_time = self._now(current_time)
         self.emergency_module.sign_emergency_action(action_id, signer, signature, current_time)
-        self._audit_log("emergency_action_signed", signer, details={"action_id": action_id})
+        self._audit_log("emergency_action_signed", signer, details=lambda: {"action_id": action_id})
 
     def execute_emergency_action(self, action_id: str, executor: str, current_time: Optional[datetime] = None) -> None:
-        if action_id not in self.emergency_module.actions:
+        action = self.emergency_module.actions.get(action_id)
+        if action is None:
             raise ValueError(f"Emergency action {action_id} not found")
 
-        action = self.emergency_module.actions[action_id]
-
-        if len(action.signatures) < self.config.emergency_threshold:
+        if not action.threshold_reached:
             raise ValueError(
                 f"Insufficient signatures: {len(action.signatures)}/{self.config.emergency_threshold}"
             )
 
-        current_time = current_time or datetime.now()
+        current_time = self._now(current_time)
 
         if action.action_type == "freeze":
             self.frozen = True
-            self.config.last_emergency_at = current_time
+            self.config.record_emergency(current_time)
             action.executed = True
             action.executed_at = current_time
-            self._audit_log("emergency_action_executed", executor, details={"action_id": action_id, "type": "freeze"})
+            self._audit_log("emergency_action_executed", executor, details=lambda: {"action_id": action_id, "type": "freeze"})
 
     def unfreeze_treasury(self, signer: str, reason: str, current_time: Optional[datetime] = None) -> None:
-        if signer not in self.config.emergency_signers:
+        if not self.permissions.get(signer, 0) & PERM_EMERGENCY:
             raise PermissionError(f"{signer} is not an emergency signer")
 
         if not self.frozen:
             raise ValueError("Treasury is not frozen")
 
-        current_time = current_time or datetime.now()
+        current_time = self._now(current_time)
         self.frozen = False
-        self._audit_log("treasury_unfrozen", signer, details={"reason": reason})
+        self._audit_log("treasury_unfrozen", signer, details=lambda: {"reason": reason})
 
     def _compute_proposal_hash(self, proposal: Proposal) -> str:
-        tx_hashes = [tx.compute_hash() for tx in proposal.transactions]
-        return hash((proposal.proposal_id, tuple(tx_hashes), proposal.category.value))
+        if proposal._cached_hash is None:
+            proposal._tx_hashes = tuple(batch_compute_hashes(proposal.transactions))
+            digest = hashlib.blake2b(_pack_str(proposal.proposal_id), digest_size=16)
+            for tx_hash in proposal._tx_hashes:
+                digest.update(tx_hash)
+            digest.update(_pack_str(_CATEGORY_VALUES[proposal.category]))
+            proposal._cached_hash = sys.intern(digest.hexdigest())
+        return proposal._cached_hash
 
     def _audit_log(
         self,
         action: str,
         actor: str,
         proposal_id: Optional[str] = None,
-        details: Optional[Dict] = None
+        details: Optional[Callable[[], Dict]] = None
     ) -> None:
-        log = TreasuryAuditLog(
-            timestamp=datetime.now(),
-            action=action,
-            actor=actor,
-            proposal_id=proposal_id,
-            details=details or {}
+        if not self._audit_enabled:
+            return
+        if details is not None:
+            details = details()
+            if self._audit_detail_level < AUDIT_DETAIL_VERBOSE:
+                for key in _VERBOSE_DETAIL_KEYS.intersection(details):
+                    del details[key]
+        ts_ns = time.monotonic_ns()
+        self._audit_buffer.append((ts_ns, action, actor, proposal_id, details))
+        self._action_index.add(action)
+        if (len(self._audit_buffer) >= AUDIT_LOG_BUFFER_SIZE
+                or ts_ns - self._audit_last_flush >= _AUDIT_LOG_FLUSH_INTERVAL_NS):
+            self._flush_audit(ts_ns)
+
+    def configure_audit(self, enabled: bool = True, detail_level: int = AUDIT_DETAIL_VERBOSE) -> None:
+        if detail_level not in (AUDIT_DETAIL_BASIC, AUDIT_DETAIL_VERBOSE):
+            raise ValueError(f"Unknown audit detail level {detail_level}")
+        self._audit_enabled = enabled
+        self._audit_detail_level = detail_level
+
+    def _now(self, current_time: Optional[datetime] = None) -> datetime:
+        if current_time is not None:
+            return current_time
+        return datetime.now()
+
+    def _anchor_audit_clock(self) -> None:
+        self._audit_epoch = datetime.now()
+        self._audit_epoch_mono = time.monotonic_ns()
+
+    def _flush_audit(self, flushed_at: Optional[int] = None) -> None:
+        buffer = self._audit_buffer
+        epoch, epoch_mono = self._audit_epoch, self._audit_epoch_mono
+        self._audit_logs.extend(
+            TreasuryAuditLog(
+                epoch + timedelta(microseconds=(ts_ns - epoch_mono) // 1000),
+                action, actor, proposal_id, details or {}
+            )
+            for ts_ns, action, actor, proposal_id, details in buffer
         )
-        self.audit_logs.append(log)
+        buffer.clear()
+        self._audit_last_flush = flushed_at or time.monotonic_ns()
+
+    # Buffered entries carry monotonic ticks that only mean something in this
+    # process, so they are materialized before pickling and the clock is
+    # re-anchored on load.
+    def __getstate__(self) -> Dict:
+        if self._audit_buffer:
+            self._flush_audit()
+        return self.__dict__.copy()
+
+    def __setstate__(self, state: Dict) -> None:
+        self.__dict__.update(state)
+        self._anchor_audit_clock()
+        self._audit_last_flush = self._audit_epoch_mono
+
+    @property
+    def audit_logs(self) -> List[TreasuryAuditLog]:
+        if self._audit_buffer:
+            self._flush_audit()
+        return self._audit_logs
 
     def get_audit_logs(self) -> List[TreasuryAuditLog]:
         return self.audit_logs
 
+    def get_audit_log_actions(self) -> FrozenSet[str]:
+        return frozenset(self._action_index)
+
+    def snapshot(self) -> bytes:
+        return pickle.dumps(self, protocol=pickle.HIGHEST_PROTOCOL)
+
+    # Snapshots are pickles: unpickling can run arbitrary code, so only
+    # restore bytes this process (or a trusted store) produced via snapshot().
+    @staticmethod
+    def restore(snapshot: bytes) -> "Treasury":
+        treasury = pickle.loads(snapshot)
+        if not isinstance(treasury, Treasury):
+            raise TypeError(f"Snapshot holds {type(treasury).__name__}, not Treasury")
+        return treasury
+
     def get_treasury_state(self) -> Dict:
         return {
             "treasury_id": self.treasury_id,
-            "signers": list(self.config.signers),
+            "signers": self.config.signers_snapshot,
             "threshold": self.config.threshold,
             "emergency_threshold": self.config.emergency_threshold,
             "frozen": self.frozen,
             "balances": self.get_all_balances(),
-            "active_proposals": len(self.list_proposals(ProposalStatus.TIME_LOCKED)),
-            "total_spending": sum(r.amount for r in self.spending_records),
-            "policies": self.policy_manager.list_policies()
+            "active_proposals": len(self._by_status[ProposalStatus.TIME_LOCKED]),
+            "total_spending": self._total_spending,
+            "policies": list(self.policy_manager.list_policies_snapshot())
         }